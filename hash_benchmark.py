@@ -0,0 +1,312 @@
+"""
+Benchmark suite for the hash table strategies in HashTable_Rahul_Khanna.py.
+
+Runs every strategy against a set of workloads (uniform, Zipfian, sequential,
+adversarial anagram keys, hit/miss mix and delete churn), timing each operation
+with perf_counter_ns after warmup runs. Reports ops/sec, p50/p99/p999 latency and
+peak traced memory, writes results to JSON and can compare against a saved baseline.
+--scenarios runs the longer scenario benchmarks of single features instead (high
+load, flooding, sharding, snapshots, ...); python3 HashTable_Rahul_Khanna.py stays a quick demo.
+
+Command Line to Run Program:
+python3 hash_benchmark.py --ops 20000 --repeat 5 --json results.json
+python3 hash_benchmark.py --compare results.json
+python3 hash_benchmark.py --scenarios all
+python3 hash_benchmark.py --scenarios flooding delete_churn
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import HashTable_Rahul_Khanna as core
+from HashTable_Rahul_Khanna import STRATEGIES, percentile
+from hash_cache import benchmark_cache
+from hash_mapped import benchmark_mapped
+from hash_perfect import benchmark_perfect
+from hash_sharded import benchmark_sharded
+
+
+# ---------------------
+# Workloads
+# ---------------------
+# A workload returns (preload items, operations); operations are (op, key, value)
+# tuples with op in "insert", "search", "delete". Keys are generated up front so
+# key construction never shows up in the timings.
+
+def workload_sequential(n, rng):
+    keys = [f"key{i}" for i in range(n)]
+    ops = [("insert", key, i) for i, key in enumerate(keys)]
+    ops += [("search", key, None) for key in keys]
+    return [], ops
+
+
+def workload_uniform(n, rng):
+    keys = [f"user:{rng.getrandbits(48):012x}" for _ in range(n)]
+    ops = [("insert", key, i) for i, key in enumerate(keys)]
+    ops += [("search", rng.choice(keys), None) for _ in range(n)]
+    return [], ops
+
+
+def workload_zipfian(n, rng, skew=1.1):
+    # Read-mostly over a fixed key set where a few hot keys take most of the traffic
+    keys = [f"item:{i}" for i in range(max(1, n // 2))]
+    weights = itertools.accumulate(1.0 / (rank + 1) ** skew for rank in range(len(keys)))
+    picks = rng.choices(keys, cum_weights=list(weights), k=n)
+    ops = [("insert", key, i) if rng.random() < 0.1 else ("search", key, None)
+           for i, key in enumerate(picks)]
+    return [(key, 0) for key in keys], ops
+
+
+def workload_anagram(n, rng):
+    # Permutations of one word: every key has the same sum of ordinals
+    letters = "abcdefghij"
+    keys = ["".join(p) for p in itertools.islice(itertools.permutations(letters), n)]
+    ops = [("insert", key, i) for i, key in enumerate(keys)]
+    ops += [("search", key, None) for key in keys]
+    return [], ops
+
+
+def workload_hit_miss(n, rng, hit_ratio=0.5):
+    keys = [f"key{i}" for i in range(n)]
+    ops = [("search", rng.choice(keys) if rng.random() < hit_ratio else f"missing{i}", None)
+           for i in range(n)]
+    return [(key, i) for i, key in enumerate(keys)], ops
+
+
+def workload_delete_churn(n, rng):
+    # Steady-size table: every round deletes a live key and inserts a fresh one
+    live = [f"key{i}" for i in range(max(1, n // 2))]
+    preload = [(key, i) for i, key in enumerate(live)]
+    ops = []
+    for i in range(n // 2):
+        slot = rng.randrange(len(live))
+        ops.append(("delete", live[slot], None))
+        live[slot] = f"churn{i}"
+        ops.append(("insert", live[slot], i))
+    return preload, ops
+
+
+WORKLOADS = {
+    "sequential": workload_sequential,
+    "uniform": workload_uniform,
+    "zipfian": workload_zipfian,
+    "anagram": workload_anagram,
+    "hit_miss": workload_hit_miss,
+    "delete_churn": workload_delete_churn,
+}
+
+
+# ---------------------
+# Runner
+# ---------------------
+def _build(strategy, hash_function, preload):
+    ht = STRATEGIES[strategy](hash_function)
+    for key, value in preload:
+        ht.insert(key, value)
+    return ht
+
+
+def _run_once(ht, ops, latencies=None):
+    # Times every operation individually; returns the wall time of the whole loop
+    methods = {"insert": ht.insert, "search": ht.search, "delete": ht.delete}
+    if latencies is None:
+        # Untimed run (warmup, memory tracing): nothing extra is allocated per op
+        for op, key, value in ops:
+            if value is None:
+                methods[op](key)
+            else:
+                methods[op](key, value)
+        return None
+
+    clock = time.perf_counter_ns
+    start = clock()
+    for op, key, value in ops:
+        method = methods[op]
+        before = clock()
+        if value is None:
+            method(key)
+        else:
+            method(key, value)
+        latencies[op].append(clock() - before)
+    return clock() - start
+
+
+def run_benchmark(strategy, workload, num_ops=20000, repeat=5, warmup=1,
+                  hash_function=None, seed=42):
+    preload, ops = WORKLOADS[workload](num_ops, random.Random(seed))
+    latencies = {"insert": [], "search": [], "delete": []}
+    run_times = []
+
+    # Strategies print on misses (e.g. direct addressing after an overwrite); keep it quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            _run_once(_build(strategy, hash_function, preload), ops)
+        for _ in range(repeat):
+            ht = _build(strategy, hash_function, preload)
+            run_times.append(_run_once(ht, ops, latencies))
+
+        # Peak memory in a separate untimed pass: tracing slows every allocation
+        tracemalloc.start()
+        _run_once(_build(strategy, hash_function, preload), ops)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    median_ns = sorted(run_times)[len(run_times) // 2]
+    all_latencies = sorted(itertools.chain.from_iterable(latencies.values()))
+    result = {
+        "strategy": strategy,
+        "workload": workload,
+        "hash_function": hash_function,
+        "ops": len(ops),
+        "ops_per_sec": len(ops) / (median_ns / 1e9) if median_ns else float("inf"),
+        "p50_ns": percentile(all_latencies, 0.50),
+        "p99_ns": percentile(all_latencies, 0.99),
+        "p999_ns": percentile(all_latencies, 0.999),
+        "peak_memory_bytes": peak_memory,
+        "by_op": {},
+    }
+    for op, values in latencies.items():
+        if values:
+            values.sort()
+            result["by_op"][op] = {
+                "count": len(values) // repeat,
+                "p50_ns": percentile(values, 0.50),
+                "p99_ns": percentile(values, 0.99),
+                "p999_ns": percentile(values, 0.999),
+            }
+    return result
+
+
+def run_suite(strategies=None, workloads=None, num_ops=20000, repeat=5, warmup=1,
+              hash_function=None, seed=42, report=True):
+    results = []
+    for workload in workloads or WORKLOADS:
+        for strategy in strategies or STRATEGIES:
+            result = run_benchmark(strategy, workload, num_ops, repeat, warmup,
+                                   hash_function, seed)
+            results.append(result)
+            if report:
+                print_result(result)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "num_ops": num_ops,
+            "repeat": repeat,
+            "warmup": warmup,
+            "hash_function": hash_function,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def print_result(result):
+    print(f"{result['workload']:>12} {result['strategy']:>20}: "
+          f"{result['ops_per_sec']:12,.0f} ops/sec  "
+          f"p50 {result['p50_ns']:7,} ns  p99 {result['p99_ns']:8,} ns  "
+          f"p999 {result['p999_ns']:9,} ns  peak {result['peak_memory_bytes'] / 1024:9,.0f} KiB")
+
+
+# ---------------------
+# Baseline Comparison
+# ---------------------
+def compare(results, baseline, threshold=0.10):
+    # Flags throughput drops and p99 increases beyond threshold; returns the regressions
+    previous = {(r["strategy"], r["workload"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for result in results["results"]:
+        old = previous.get((result["strategy"], result["workload"]))
+        if old is None:
+            continue
+        throughput = result["ops_per_sec"] / old["ops_per_sec"] - 1
+        tail = result["p99_ns"] / old["p99_ns"] - 1 if old["p99_ns"] else 0.0
+        flagged = throughput < -threshold or tail > threshold
+        if flagged:
+            regressions.append((result["strategy"], result["workload"], throughput, tail))
+        print(f"{'REGRESSION' if flagged else 'ok':>10} {result['workload']:>12} "
+              f"{result['strategy']:>20}: ops/sec {throughput:+7.1%}, p99 {tail:+7.1%}")
+    return regressions
+
+
+# ---------------------
+# Scenario Benchmarks
+# ---------------------
+# Longer benchmarks of single features, each printing its own report
+SCENARIOS = {
+    "high_load": core.benchmark_high_load,
+    "batch": lambda: [core.benchmark_batch(strategy_class) for strategy_class in (
+        core.HashTableChaining, core.HashTableLinearProbing, core.HashTableRobinHood,
+        core.HashTableCompact)],
+    "long_chains": core.benchmark_long_chains,
+    "flooding": core.benchmark_flooding,
+    "delete_churn": core.benchmark_delete_churn,
+    "concurrency": core.benchmark_concurrency,
+    "sharded": benchmark_sharded,
+    "mapped": benchmark_mapped,
+    "snapshot": core.benchmark_snapshot,
+    "cache": benchmark_cache,
+    "from_items": lambda: core.benchmark_from_items(sizes=(1000000,)),  # 10M keys: benchmark_from_items()
+    "cached_hashes": core.benchmark_cached_hashes,
+    "adaptive": core.benchmark_adaptive,
+    "perfect": benchmark_perfect,
+    "prefilter": core.benchmark_prefilter,
+    "memory": lambda: core.memory_report(num_keys=20000),
+}
+if core.np is not None:
+    SCENARIOS["bulk_hashing"] = core.benchmark_bulk_hashing
+
+
+def run_scenarios(names):
+    for name in names:
+        print(f"\n=== {name} ===")
+        SCENARIOS[name]()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hash table strategies.")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES))
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS))
+    parser.add_argument("--ops", type=int, default=20000, help="operations per workload")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--hash", dest="hash_function", default=None,
+                        help="hash function name for every table (default: table default)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative change that counts as a regression")
+    parser.add_argument("--scenarios", nargs="+", choices=["all", *SCENARIOS],
+                        help="run these scenario benchmarks instead of the workload suite")
+    args = parser.parse_args(argv)
+
+    if args.scenarios:
+        run_scenarios(list(SCENARIOS) if "all" in args.scenarios else args.scenarios)
+        return 0
+    results = run_suite(args.strategies, args.workloads, args.ops, args.repeat,
+                        args.warmup, args.hash_function, args.seed)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Bounded cache on top of the hash tables in HashTable_Rahul_Khanna.py.
+
+HashTableCache caps a table by entry count or bytes and evicts by LRU, CLOCK or S3-FIFO,
+with optional per-entry expiry.
+
+Command Line to Run Program:
+python3 hash_cache.py
+"""
+
+import heapq
+import itertools
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from HashTable_Rahul_Khanna import HashTable, HashTableChaining
+
+
+# ---------------------
+# Bounded Cache
+# ---------------------
+CACHE_POLICIES = ("lru", "clock", "s3fifo")
+
+class _CacheEntry:
+    __slots__ = ("key", "value", "size", "expires", "frequency", "in_main", "prev", "next")
+
+    def __init__(self, key=None, value=None, size=0, expires=None):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.frequency = 0  # CLOCK reference bit, or the S3-FIFO access count (0-3)
+        self.in_main = False
+
+class _CacheQueue:
+    # Doubly linked list around a sentinel: push at the front, take from the back, unlink anywhere
+    __slots__ = ("head", "length")
+
+    def __init__(self):
+        self.head = _CacheEntry()
+        self.head.prev = self.head.next = self.head
+        self.length = 0
+
+    def push_front(self, entry):
+        entry.prev, entry.next = self.head, self.head.next
+        self.head.next.prev = entry
+        self.head.next = entry
+        self.length += 1
+
+    def remove(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        self.length -= 1
+
+    def back(self):
+        return self.head.prev if self.length else None
+
+def _entry_size(key, value):
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+class HashTableCache:
+    # Capacity-bounded cache over a HashTable: keys map to entries that also sit in an
+    # eviction queue, so every policy does O(1) bookkeeping per operation.
+    #   lru:    hits move to the front, evict from the back
+    #   clock:  hits set a reference bit; the back entry gets a second chance if it is set
+    #   s3fifo: new keys enter a small FIFO (about 10% of entries); keys hit there are
+    #           promoted to the main FIFO, the rest leave a ghost key so a quick return
+    #           goes straight to main. Scan-resistant: one-off keys never reach main.
+    # TTLs expire lazily on lookup and periodically (every expire_interval operations)
+    # from a heap of deadlines, so expired entries that are never read still go away.
+    def __init__(self, max_entries=None, max_bytes=None, policy="lru", default_ttl=None,
+                 table=None, sizeof=None, expire_interval=1000, clock=time.monotonic):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"policy must be one of {CACHE_POLICIES}, got '{policy}'")
+        if max_entries is None and max_bytes is None:
+            raise ValueError("set max_entries, max_bytes or both")
+        self.table = table or HashTable(HashTableChaining())
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.default_ttl = default_ttl
+        self.sizeof = sizeof or _entry_size  # bytes charged per entry against max_bytes
+        self.expire_interval = expire_interval
+        self.clock = clock
+
+        self.queue = _CacheQueue()  # the only queue for lru/clock, the small FIFO for s3fifo
+        self.main = _CacheQueue()
+        self.ghosts = OrderedDict()
+        self.deadlines = []  # heap of (expires, sequence, entry); stale items are skipped
+        self.sequence = 0
+        self.count = 0
+        self.bytes = 0
+        self.operations = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self):
+        return self.count
+
+    def _tick(self):
+        self.operations += 1
+        if self.deadlines and self.operations % self.expire_interval == 0:
+            self.expire()
+
+    def insert(self, key, value, ttl=None):
+        self._tick()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires = None if ttl is None else self.clock() + ttl
+        size = self.sizeof(key, value)
+        entry = self.table.search(key)
+        if entry is not None:
+            # Update existing key; counts as a use for every policy
+            self.bytes += size - entry.size
+            entry.value, entry.size, entry.expires = value, size, expires
+            self._touch(entry)
+        else:
+            entry = _CacheEntry(key, value, size, expires)
+            self.table.insert(key, entry)
+            self.count += 1
+            self.bytes += size
+            if self.policy == "s3fifo" and key in self.ghosts:
+                del self.ghosts[key]
+                entry.in_main = True
+                self.main.push_front(entry)
+            else:
+                self.queue.push_front(entry)
+
+        if expires is not None:
+            heapq.heappush(self.deadlines, (expires, self.sequence, entry))
+            self.sequence += 1
+            if len(self.deadlines) > 2 * self.count + 64:
+                # Mostly superseded deadlines: rebuild from the live entries
+                self.deadlines = [item for item in self.deadlines
+                                  if item[2].expires == item[0] and self.table.search(item[2].key) is item[2]]
+                heapq.heapify(self.deadlines)
+        self._evict()
+
+    def search(self, key):
+        self._tick()
+        entry = self.table.search(key)
+        if entry is not None and entry.expires is not None and entry.expires <= self.clock():
+            self._remove(entry)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def delete(self, key):
+        self._tick()
+        entry = self.table.search(key)
+        if entry is None:
+            print(f"Key '{key}' not found in cache.")
+            return
+        self._remove(entry)
+
+    def _touch(self, entry):
+        if self.policy == "lru":
+            self.queue.remove(entry)
+            self.queue.push_front(entry)
+        elif self.policy == "clock":
+            entry.frequency = 1
+        else:
+            entry.frequency = min(entry.frequency + 1, 3)
+
+    def _remove(self, entry):
+        (self.main if entry.in_main else self.queue).remove(entry)
+        self.table.delete(entry.key)
+        self.count -= 1
+        self.bytes -= entry.size
+
+    def _over_capacity(self):
+        return ((self.max_entries is not None and self.count > self.max_entries) or
+                (self.max_bytes is not None and self.bytes > self.max_bytes))
+
+    def _evict(self):
+        while self.count and self._over_capacity():
+            self._remove(self._victim())
+            self.evictions += 1
+
+    def _victim(self):
+        # Picks the entry to evict; second chances and promotions happen along the way
+        if self.policy == "lru":
+            return self.queue.back()
+        if self.policy == "clock":
+            while True:
+                entry = self.queue.back()
+                if not entry.frequency:
+                    return entry
+                entry.frequency = 0
+                self.queue.remove(entry)
+                self.queue.push_front(entry)
+
+        while True:
+            if self.main.length == 0 or 10 * self.queue.length >= self.count:
+                entry = self.queue.back()
+                if not entry.frequency:
+                    self.ghosts[entry.key] = None
+                    while len(self.ghosts) > max(self.main.length, 1):
+                        self.ghosts.popitem(last=False)
+                    return entry
+                # Used while in the small queue: promote to main
+                self.queue.remove(entry)
+                entry.frequency = 0
+                entry.in_main = True
+                self.main.push_front(entry)
+            else:
+                entry = self.main.back()
+                if not entry.frequency:
+                    return entry
+                entry.frequency -= 1
+                self.main.remove(entry)
+                self.main.push_front(entry)
+
+    def expire(self):
+        # Drops every entry past its deadline; returns how many went
+        now = self.clock()
+        removed = 0
+        while self.deadlines and self.deadlines[0][0] <= now:
+            expires, _, entry = heapq.heappop(self.deadlines)
+            # Skip deadlines superseded by an update, and entries already gone
+            if entry.expires == expires and self.table.search(entry.key) is entry:
+                self._remove(entry)
+                removed += 1
+        self.expirations += removed
+        return removed
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "policy": self.policy,
+            "entries": self.count,
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "table": self.table.stats(),
+        }
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def benchmark_cache(num_ops=100000, capacity=1000, num_keys=10000, skew=1.0, seed=42):
+    # Read-through cache on a Zipfian key stream with a sequential scan mixed in:
+    # hit rate and throughput per eviction policy at the same capacity
+    rng = random.Random(seed)
+    weights = list(itertools.accumulate(1.0 / (rank + 1) ** skew for rank in range(num_keys)))
+    stream = rng.choices(range(num_keys), cum_weights=weights, k=num_ops)
+    scan = list(range(num_keys, num_keys + capacity * 2))
+    stream[num_ops // 2:num_ops // 2] = scan  # one-off keys that should not flush hot ones
+    keys = [f"key{i}" for i in stream]
+
+    print(f"\nCache Policies ({len(keys)} lookups, {capacity} entries, Zipf {skew} + scan):")
+    for policy in CACHE_POLICIES:
+        cache = HashTableCache(max_entries=capacity, policy=policy)
+        start = time.perf_counter()
+        for key in keys:
+            if cache.search(key) is None:
+                cache.insert(key, key)
+        elapsed = time.perf_counter() - start
+        stats = cache.stats()
+        print(f"{policy:>8}: hit rate {stats['hit_rate']:.3f}, evictions {stats['evictions']}, "
+              f"{len(keys) / elapsed:,.0f} lookups/sec")
+
+
+# ---------------------
+# Demo
+# ---------------------
+def main():
+    print("Bounded Cache")
+    cache = HashTableCache(max_entries=2, policy="lru")
+    cache.insert("apple", 1)
+    cache.insert("papel", 2)
+    cache.search("apple")       # apple is now the most recently used
+    cache.insert("elppa", 3)    # evicts papel
+    print(cache.search("papel"), cache.search("apple"))  # None 1
+    print({k: v for k, v in cache.stats().items() if k in ("hits", "misses", "evictions")})
+    benchmark_cache(num_ops=20000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Membership prefilters for the HashTable facade in HashTable_Rahul_Khanna.py.
+
+Bloom, blocked Bloom and counting Bloom filters over the table's own 64-bit key hashes.
+A key the filter has never seen is reported missing without touching the table.
+"""
+
+import functools
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:  # only the vectorized might_contain_many() path needs NumPy
+    np = None
+
+MASK64 = (1 << 64) - 1
+
+
+# ---------------------
+# Membership Prefilters
+# ---------------------
+# Filters see the table's own hash of each key. One multiply (Fibonacci hashing) remixes
+# it so weak hashes (small ints, custom callables) still reach the high bits, which pick
+# the positions; the full _fmix64 finalizer would cost more than the probes it saves.
+_BLOOM_MUL = 0x9E3779B97F4A7C15
+
+class BloomFilter:
+    # num_hashes bits per key anywhere in one bit array, placed by double hashing. Sized
+    # for capacity keys at the target false-positive rate; no false negatives ever.
+    supports_delete = False
+
+    def __init__(self, capacity, fpr=0.01):
+        if not 0 < fpr < 1:
+            raise ValueError(f"fpr must be between 0 and 1, got {fpr}")
+        self.capacity = max(1, int(capacity))
+        self.fpr = fpr
+        self.num_hashes = max(1, round(-math.log2(fpr)))
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(fpr) / math.log(2) ** 2))
+        self._allocate()
+
+    def _allocate(self):
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, h):
+        g = (h & MASK64) * _BLOOM_MUL & MASK64
+        m = self.num_bits
+        position, step = (g >> 32) % m, ((g & 0xFFFFFFFF) | 1) % m
+        positions = [position]
+        for _ in range(self.num_hashes - 1):
+            position = (position + step) % m
+            positions.append(position)
+        return positions
+
+    def add(self, h):
+        bits = self.bits
+        for position in self._positions(h):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, h):
+        # Same positions as _positions(), computed lazily: most misses stop at the first
+        g = (h & MASK64) * _BLOOM_MUL & MASK64
+        m, bits = self.num_bits, self.bits
+        position, step = (g >> 32) % m, ((g & 0xFFFFFFFF) | 1) % m
+        for _ in range(self.num_hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % m
+        return True
+
+    def might_contain_many(self, hashes):
+        # One vectorized pass for a uint64 array of hashes, else one call per hash
+        if isinstance(hashes, list):
+            return [self.might_contain(h) for h in hashes]
+        g = hashes * np.uint64(_BLOOM_MUL)
+        m = np.uint64(self.num_bits)
+        position = (g >> np.uint64(32)) % m
+        step = ((g & np.uint64(0xFFFFFFFF)) | np.uint64(1)) % m
+        result = np.ones(len(hashes), dtype=bool)
+        for _ in range(self.num_hashes):
+            result &= self._test_many(position.astype(np.intp))
+            position = (position + step) % m
+        return result.tolist()
+
+    def _test_many(self, positions):
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        return (bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1 == 1
+
+    def size_bytes(self):
+        return len(self.bits)
+
+
+@functools.lru_cache(maxsize=None)
+def _block_patterns(num_hashes, seed, bits=512, count=4096):
+    # Precomputed masks of num_hashes distinct bits within one block
+    rng = random.Random(num_hashes * 2 + seed)
+    return [sum(1 << bit for bit in rng.sample(range(bits), num_hashes)) for _ in range(count)]
+
+class BlockedBloomFilter(BloomFilter):
+    # All of a key's bits fall in one 512-bit block (a cache line in a native table).
+    # Blocks are Python ints and a key's bits are two precomputed patterns ORed together
+    # (16 million combinations), so a check is one integer AND instead of num_hashes bit
+    # tests. Blocks fill unevenly, so the array is grown until the expected rate over a
+    # Poisson spread of keys per block meets the target.
+    BLOCK_BITS = 512
+
+    def _allocate(self):
+        num_blocks = max(1, math.ceil(self.num_bits / self.BLOCK_BITS))
+        while self._expected_fpr(self.capacity / num_blocks) > self.fpr:
+            num_blocks = math.ceil(num_blocks * 1.05)
+        self.num_blocks = num_blocks
+        self.num_bits = num_blocks * self.BLOCK_BITS
+        self.blocks = [0] * num_blocks
+        half = self.num_hashes // 2
+        self.low_patterns = _block_patterns(self.num_hashes - half, 0, self.BLOCK_BITS)
+        self.high_patterns = _block_patterns(half, 1, self.BLOCK_BITS)
+
+    def _expected_fpr(self, keys_per_block):
+        k, total = self.num_hashes, 0.0
+        weight = math.exp(-keys_per_block)  # Poisson probability of an empty block
+        for load in range(int(keys_per_block + 10 * math.sqrt(keys_per_block) + 10)):
+            total += weight * (1 - (1 - 1 / self.BLOCK_BITS) ** (k * load)) ** k
+            weight *= keys_per_block / (load + 1)
+        return total
+
+    def add(self, h):
+        g = (h & MASK64) * _BLOOM_MUL & MASK64
+        pattern = self.low_patterns[g & 4095] | self.high_patterns[(g >> 12) & 4095]
+        self.blocks[((g >> 32) * self.num_blocks) >> 32] |= pattern
+
+    def might_contain(self, h):
+        g = (h & MASK64) * _BLOOM_MUL & MASK64
+        pattern = self.low_patterns[g & 4095] | self.high_patterns[(g >> 12) & 4095]
+        return self.blocks[((g >> 32) * self.num_blocks) >> 32] & pattern == pattern
+
+    def might_contain_many(self, hashes):
+        if not isinstance(hashes, list):
+            hashes = hashes.tolist()
+        return [self.might_contain(h) for h in hashes]
+
+    def size_bytes(self):
+        return self.num_blocks * self.BLOCK_BITS // 8
+
+
+class CountingBloomFilter(BloomFilter):
+    # A byte counter per position instead of a bit, so keys can be removed. A counter
+    # that reaches 255 stays there: it can no longer tell how many keys share it.
+    supports_delete = True
+
+    def _allocate(self):
+        self.counters = bytearray(self.num_bits)
+
+    def add(self, h):
+        counters = self.counters
+        for position in self._positions(h):
+            if counters[position] < 255:
+                counters[position] += 1
+
+    def remove(self, h):
+        # Only for a key known to have been added
+        counters = self.counters
+        for position in self._positions(h):
+            if counters[position] < 255:
+                counters[position] -= 1
+
+    def might_contain(self, h):
+        g = (h & MASK64) * _BLOOM_MUL & MASK64
+        m, counters = self.num_bits, self.counters
+        position, step = (g >> 32) % m, ((g & 0xFFFFFFFF) | 1) % m
+        for _ in range(self.num_hashes):
+            if not counters[position]:
+                return False
+            position = (position + step) % m
+        return True
+
+    def _test_many(self, positions):
+        return np.frombuffer(self.counters, dtype=np.uint8)[positions] > 0
+
+    def size_bytes(self):
+        return len(self.counters)
+
+
+PREFILTERS = {"bloom": BloomFilter, "blocked": BlockedBloomFilter,
+              "counting": CountingBloomFilter}
@@ -0,0 +1,256 @@
+"""
+Streaming bulk loader for the hash tables in HashTable_Rahul_Khanna.py.
+
+Reads CSV, TSV or JSONL files record by record through generators and feeds the batch
+insert path (insert_many) in fixed-size chunks, so memory stays bounded by the chunk size
+however large the file is. The target table can be pre-sized from an estimate of the
+number of keys: from the file size and a sample of lines, or from a HyperLogLog first
+pass over the keys. Progress and throughput are reported while loading.
+
+Command Line to Run Program:
+python3 hash_loader.py data.csv --key id --value name --estimate hll
+python3 hash_loader.py events.jsonl --key user --strategy compact --snapshot events.snap
+python3 hash_loader.py --benchmark
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+from HashTable_Rahul_Khanna import STRATEGIES, HashTable, MASK64, hash_many, murmur_hash, np
+
+FORMATS = {".csv": "csv", ".tsv": "tsv", ".tab": "tsv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+ESTIMATES = ("none", "size", "hll")
+
+
+# ---------------------
+# Record Readers
+# ---------------------
+def detect_format(path):
+    fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"Cannot tell the format of '{path}'; pass one of {sorted(set(FORMATS.values()))}")
+    return fmt
+
+
+def read_records(stream, fmt, key_field="key", value_field=None, header=True):
+    # Yields (key, value) from a binary stream. key_field/value_field are column names
+    # (CSV/TSV with a header, JSONL) or column indexes (CSV/TSV without one); with no
+    # value_field the whole record is the value.
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    if fmt == "jsonl":
+        for line in text:
+            if line.strip():
+                record = json.loads(line)
+                yield str(record[key_field]), record if value_field is None else record[value_field]
+        return
+
+    delimiter = "\t" if fmt == "tsv" else ","
+    if header:
+        reader = csv.DictReader(text, delimiter=delimiter)
+    else:
+        reader = csv.reader(text, delimiter=delimiter)
+        key_field = int(key_field)
+        value_field = None if value_field is None else int(value_field)
+    for record in reader:
+        yield record[key_field], record if value_field is None else record[value_field]
+
+
+def chunks(iterable, size):
+    # Lists of up to size items; only one chunk is ever held in memory
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ---------------------
+# Cardinality Estimates
+# ---------------------
+class HyperLogLog:
+    # Distinct-key estimate in 2**precision bytes of registers (16 KiB by default,
+    # about 0.8% standard error) no matter how many keys are added
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+
+    def add_many(self, keys):
+        p = self.precision
+        if np is not None:
+            hashes = hash_many(keys, "murmur")
+            indices = (hashes >> np.uint64(64 - p)).astype(np.intp)
+            rest = (hashes << np.uint64(p)) | np.uint64(1 << (p - 1))  # sentinel caps the rank
+            # Rank = leading zeros + 1, read off the float64 exponent (rounding only
+            # matters within 2**-53 of a power of two)
+            ranks = (64 - np.floor(np.log2(rest.astype(np.float64)))).astype(np.uint8)
+            registers = np.frombuffer(self.registers, dtype=np.uint8)
+            np.maximum.at(registers, indices, ranks)
+            return
+        for key in keys:
+            h = murmur_hash(key)
+            index = h >> (64 - p)
+            rest = ((h << p) & MASK64) | (1 << (p - 1))
+            rank = 64 - rest.bit_length() + 1
+            if rank > self.registers[index]:
+                self.registers[index] = rank
+
+    def estimate(self):
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))  # small-range correction
+        return round(raw)
+
+
+def estimate_from_size(path, sample_lines=1000):
+    # Records ~ file size / mean line length over the first sample_lines lines
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        lengths = [len(line) for line in itertools.islice(f, sample_lines)]
+    if not lengths:
+        return 0
+    if len(lengths) < sample_lines:
+        return len(lengths)
+    return int(size / (sum(lengths) / len(lengths)))
+
+
+def estimate_keys(path, method, fmt, key_field="key", header=True, chunk_size=10000):
+    if method == "none":
+        return None
+    if method == "size":
+        return estimate_from_size(path)
+    if method == "hll":
+        # First pass over the keys only; values are read but never kept
+        hll = HyperLogLog()
+        with open(path, "rb") as stream:
+            for chunk in chunks(read_records(stream, fmt, key_field, None, header), chunk_size):
+                hll.add_many([key for key, _ in chunk])
+        return hll.estimate()
+    raise ValueError(f"estimate must be one of {ESTIMATES}, got '{method}'")
+
+
+# ---------------------
+# Loader
+# ---------------------
+def _print_progress(rows, fraction, elapsed, done=False):
+    rate = rows / elapsed if elapsed else 0.0
+    line = f"\r{rows:12,} rows  {fraction:6.1%}  {rate:12,.0f} rows/sec  {elapsed:7.1f}s"
+    print(line, end="\n" if done else "", file=sys.stderr, flush=True)
+
+
+def load(path, table=None, fmt=None, key_field="key", value_field=None, header=True,
+         chunk_size=10000, estimate="size", progress=_print_progress, report_every=0.5):
+    # Streams the file into table (a HashTable or a strategy; HashTableCompact by
+    # default) and returns (table, report)
+    fmt = fmt or detect_format(path)
+    table = table if table is not None else HashTable(STRATEGIES["compact"](None))
+    strategy = table.strategy if isinstance(table, HashTable) else table
+
+    start = time.perf_counter()
+    expected = estimate_keys(path, estimate, fmt, key_field, header, chunk_size)
+    estimate_time = time.perf_counter() - start
+    if expected:
+        strategy.reserve(expected)
+
+    size = os.path.getsize(path) or 1
+    rows = 0
+    start = last_report = time.perf_counter()
+    with open(path, "rb") as stream:
+        for chunk in chunks(read_records(stream, fmt, key_field, value_field, header), chunk_size):
+            table.insert_many(chunk)
+            rows += len(chunk)
+            now = time.perf_counter()
+            if progress and now - last_report >= report_every:
+                # The raw stream runs at most one read buffer ahead of the parser
+                progress(rows, min(stream.tell() / size, 1.0), now - start)
+                last_report = now
+    elapsed = time.perf_counter() - start
+    if progress:
+        progress(rows, 1.0, elapsed, done=True)
+
+    report = {
+        "rows": rows,
+        "entries": getattr(strategy, "count", None),
+        "estimate": expected,
+        "estimate_seconds": estimate_time,
+        "load_seconds": elapsed,
+        "rows_per_sec": rows / elapsed if elapsed else float("inf"),
+        "table_size": strategy.table_size,
+        "resizes": strategy.resizes,
+    }
+    return table, report
+
+
+def benchmark_loader(num_rows=200000, strategy="compact"):
+    # Naive insert() loop into a default-size table versus the streaming loader
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "rows.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "name"])
+            for i in range(num_rows):
+                writer.writerow([f"user{i}", f"name{i}"])
+
+        print(f"\nBulk Loading {num_rows} CSV rows into {strategy}:")
+        start = time.perf_counter()
+        ht = STRATEGIES[strategy](None)
+        with open(path, newline="") as f:
+            for record in csv.DictReader(f):
+                ht.insert(record["id"], record["name"])
+        naive = time.perf_counter() - start
+        print(f"{'insert() loop':>20}: {naive:.3f}s, {ht.resizes} resizes")
+
+        for method in ESTIMATES:
+            table, report = load(path, HashTable(STRATEGIES[strategy](None)), key_field="id",
+                                 value_field="name", estimate=method, progress=None)
+            print(f"{'loader, ' + method:>20}: {report['estimate_seconds'] + report['load_seconds']:.3f}s "
+                  f"(estimate {report['estimate']}), {report['resizes']} resizes")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a CSV/TSV/JSONL file into a hash table.")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())))
+    parser.add_argument("--key", default="key", help="key column name (or index with --no-header)")
+    parser.add_argument("--value", help="value column (default: the whole record)")
+    parser.add_argument("--no-header", dest="header", action="store_false")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="compact")
+    parser.add_argument("--hash", dest="hash_function", default=None)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--estimate", choices=ESTIMATES, default="size")
+    parser.add_argument("--snapshot", help="dump() the loaded table to this file")
+    parser.add_argument("--benchmark", action="store_true", help="compare against an insert() loop")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_loader()
+        return 0
+    if args.path is None:
+        parser.error("path is required unless --benchmark is given")
+
+    table, report = load(args.path, HashTable(STRATEGIES[args.strategy](args.hash_function)),
+                         args.format, args.key, args.value, args.header, args.chunk_size,
+                         args.estimate)
+    print(json.dumps(report, indent=2))
+    if args.snapshot:
+        table.dump(args.snapshot)
+        print(f"Snapshot written to {args.snapshot}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Memory-mapped on-disk hash table for the strategies in HashTable_Rahul_Khanna.py.
+
+HashTableMapped keeps its slots in a file that is opened with mmap, so a table written
+once by one process can be opened instantly, and shared, by others without rebuilding it.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+from HashTable_Rahul_Khanna import (
+    DEFAULT_HASH_FUNCTION,
+    DEFAULT_SEEDED_HASH_FUNCTION,
+    HASH_FUNCTIONS,
+    MASK64,
+    SEEDED_HASH_FUNCTIONS,
+    HashTableCompact,
+    HashTableStrategy,
+    get_hash_function,
+    random_seed,
+)
+
+
+# ---------------------
+# Memory-Mapped On-Disk Table
+# ---------------------
+MAPPED_MAGIC = b"HTMAP\x00\x02\x00"
+# magic, byte-order mark, has seed, table_size, count, heap end, hash name, 128-bit seed
+MAPPED_HEADER = struct.Struct("<8sIIQQQ16s16s")
+MAPPED_COUNTS = struct.Struct("<QQ")  # count and heap end, rewritten after every change
+MAPPED_COUNTS_OFFSET = 24
+MAPPED_HEADER_SIZE = 128  # padded so the slot array starts 8-byte aligned
+MAPPED_RECORD = struct.Struct("<II")  # key length, value length
+_BYTE_ORDER_MARK = 0x01020304
+_FLOAT = struct.Struct("<d")
+
+
+# Keys and values are written with a one-byte type tag instead of being pickled, so
+# reading a shared file never runs code, and the tag keeps "1" and b"1" apart. Keys are
+# str or bytes (hashed as UTF-8 or raw bytes); values are None, bool, int, float, str
+# or bytes. Anything else is a TypeError.
+def _encode_key(key):
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8")
+    if isinstance(key, bytes):
+        return b"b" + key
+    raise TypeError(f"HashTableMapped keys must be str or bytes, not {type(key).__name__}")
+
+
+def _decode_key(data):
+    return data[1:].decode("utf-8") if data[:1] == b"s" else bytes(data[1:])
+
+
+def _encode_value(value):
+    if value is None:
+        return b"n"
+    if isinstance(value, bool):
+        return b"t" if value else b"f"
+    if isinstance(value, int):
+        return b"i" + value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+    if isinstance(value, float):
+        return b"d" + _FLOAT.pack(value)
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8")
+    if isinstance(value, bytes):
+        return b"b" + value
+    raise TypeError(f"HashTableMapped values must be None, bool, int, float, str or bytes, "
+                    f"not {type(value).__name__}")
+
+
+def _decode_value(data):
+    tag, payload = data[:1], data[1:]
+    if tag == b"n":
+        return None
+    if tag in (b"t", b"f"):
+        return tag == b"t"
+    if tag == b"i":
+        return int.from_bytes(payload, "little", signed=True)
+    if tag == b"d":
+        return _FLOAT.unpack(payload)[0]
+    if tag == b"s":
+        return payload.decode("utf-8")
+    if tag == b"b":
+        return bytes(payload)
+    raise ValueError(f"unknown value tag {tag!r} in mapped table record")
+
+
+class HashTableMapped(HashTableStrategy):
+    # Linear probing kept in a file and opened with mmap: opening costs the same at any
+    # size, pages are read on demand and the page cache is shared between processes.
+    # Layout: header, then table_size slots of (hash, record offset) as native uint64
+    # (offset 0 marks an empty slot), then a heap of records: key length, value length,
+    # tagged key, tagged value. Keys are hashed as the bytes the hash functions see
+    # (UTF-8 for str), so the hash function must be a named, process-independent one.
+    # An update appends a new record and repoints its slot; the old record stays in the
+    # heap until the next resize, which copies live records only.
+    def __init__(self, path, writable=False, max_load_factor=0.75):
+        self.path = path
+        self.writable = writable
+        self.max_load_factor = max_load_factor
+        self._open()
+
+    @classmethod
+    def create(cls, path, items=(), table_size=11, hash_function=None, seed=None,
+               max_load_factor=0.75):
+        # Writes a new table file (replacing any existing one) and returns it opened writable.
+        # The seed is checked as any table's is and made concrete ("random" draws one), so
+        # the header holds the seed every process opening the file will hash with.
+        name = hash_function or (DEFAULT_HASH_FUNCTION if seed is None
+                                 else DEFAULT_SEEDED_HASH_FUNCTION)
+        if name not in HASH_FUNCTIONS or name == "python":
+            raise ValueError(f"hash_function must be one of "
+                             f"{sorted(set(HASH_FUNCTIONS) - {'python'})}, got '{name}'")
+        if seed == "random":
+            seed = random_seed()
+        get_hash_function(name, seed)  # raises if this hash cannot take a seed
+        items = list(items)
+        if max_load_factor is not None:
+            while len(items) > max_load_factor * table_size:
+                table_size *= 2
+        cls._write_empty(path, table_size, name, seed, heap_capacity=64 * table_size)
+        ht = cls(path, writable=True, max_load_factor=max_load_factor)
+        ht.insert_many(items)
+        return ht
+
+    @staticmethod
+    def _write_empty(path, table_size, hash_name, seed, heap_capacity):
+        heap_start = MAPPED_HEADER_SIZE + 16 * table_size
+        header = MAPPED_HEADER.pack(MAPPED_MAGIC, _BYTE_ORDER_MARK, seed is not None,
+                                    table_size, 0, heap_start, hash_name.encode(),
+                                    (seed or 0).to_bytes(16, "little"))
+        with open(path, "wb") as f:
+            f.write(header)
+            # Sparse on most file systems: unused slots and heap cost no disk blocks
+            f.truncate(heap_start + max(heap_capacity, mmap.PAGESIZE))
+
+    def _open(self):
+        self.file = open(self.path, "r+b" if self.writable else "rb")
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=access)
+        (magic, byte_order, has_seed, self.table_size, self.count, self.heap_end,
+         hash_name, seed) = MAPPED_HEADER.unpack_from(self.mm)
+        if magic != MAPPED_MAGIC:
+            self.close()
+            raise ValueError(f"'{self.path}' is not a mapped hash table file")
+        if byte_order != _BYTE_ORDER_MARK:
+            self.close()
+            raise ValueError(f"'{self.path}' was written on a machine with another byte order")
+        self.hash_name = hash_name.rstrip(b"\x00").decode()
+        # Files written before seeds were checked may record one their hash never used
+        has_seed = has_seed and self.hash_name in SEEDED_HASH_FUNCTIONS
+        self.seed = int.from_bytes(seed, "little") if has_seed else None
+        self.hash_function = get_hash_function(self.hash_name, self.seed)
+        # Zero-copy view of the slot array: slots[2 * i] is the hash, slots[2 * i + 1] the offset
+        self.slots = memoryview(self.mm)[MAPPED_HEADER_SIZE:
+                                         MAPPED_HEADER_SIZE + 16 * self.table_size].cast("Q")
+
+    def close(self):
+        if self.mm is None:
+            return
+        if getattr(self, "slots", None) is not None:
+            self.slots.release()
+            self.slots = None
+        if self.writable:
+            self.mm.flush()
+        self.mm.close()
+        self.file.close()
+        self.mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_writable(self):
+        if not self.writable:
+            raise ValueError(f"'{self.path}' was opened read-only")
+
+    def _record(self, offset):
+        key_length, value_length = MAPPED_RECORD.unpack_from(self.mm, offset)
+        return offset + MAPPED_RECORD.size, key_length, value_length
+
+    def _key_at(self, offset):
+        start, key_length, _ = self._record(offset)
+        return self.mm[start:start + key_length]
+
+    def _value_at(self, offset):
+        start, key_length, value_length = self._record(offset)
+        start += key_length
+        return _decode_value(self.mm[start:start + value_length])
+
+    def _find(self, key_bytes, h):
+        slots, size = self.slots, self.table_size
+        index = h % size
+        for _ in range(size):
+            offset = slots[2 * index + 1]
+            if offset == 0:
+                break
+            # Integer comparison first; key bytes are only read on a full hash match
+            if slots[2 * index] == h and self._key_at(offset) == key_bytes:
+                return index
+            index = (index + 1) % size
+        return None  # Not found
+
+    def _append(self, record):
+        # Copies a packed record to the end of the heap, growing the file if needed
+        end = self.heap_end + len(record)
+        if end > len(self.mm):
+            self._grow_file(max(end, 2 * len(self.mm)))
+        self.mm[self.heap_end:end] = record
+        offset, self.heap_end = self.heap_end, end
+        return offset
+
+    def _grow_file(self, new_size):
+        # The slot view pins the old mapping, so drop everything and map the file again
+        self.slots.release()
+        self.mm.close()
+        self.file.truncate(new_size)
+        self.file.close()
+        self._open()
+
+    def _place(self, h, offset):
+        slots, size = self.slots, self.table_size
+        index = h % size
+        for _ in range(size):
+            if slots[2 * index + 1] == 0:
+                slots[2 * index] = h
+                slots[2 * index + 1] = offset
+                self.count += 1
+                return True
+            index = (index + 1) % size
+        print("HashTable is full")
+        return False
+
+    def _write_counts(self):
+        MAPPED_COUNTS.pack_into(self.mm, MAPPED_COUNTS_OFFSET, self.count, self.heap_end)
+
+    def insert(self, key, value):
+        self._insert_hashed(key, value, self.hash_function(key))
+
+    def search(self, key):
+        return self._search_hashed(key, self.hash_function(key))
+
+    def delete(self, key):
+        if not self._delete_hashed(key, self.hash_function(key)):
+            print(f"Key '{key}' not found in mapped table.")
+
+    def _insert_hashed(self, key, value, h):
+        self._check_writable()
+        h &= MASK64
+        key_bytes = _encode_key(key)
+        value_bytes = _encode_value(value)
+        index = self._find(key_bytes, h)
+        if index is None and (self.max_load_factor is not None
+                              and self.count + 1 > self.max_load_factor * self.table_size):
+            self.resize(self.table_size * 2)
+        offset = self._append(MAPPED_RECORD.pack(len(key_bytes), len(value_bytes))
+                              + key_bytes + value_bytes)
+        if index is not None:
+            # Update existing key: point the slot at the new record
+            self.slots[2 * index + 1] = offset
+        else:
+            self._place(h, offset)
+        self._write_counts()
+
+    def _search_hashed(self, key, h, default=None):
+        index = self._find(_encode_key(key), h & MASK64)
+        return default if index is None else self._value_at(self.slots[2 * index + 1])
+
+    def _delete_hashed(self, key, h):
+        self._check_writable()
+        index = self._find(_encode_key(key), h & MASK64)
+        if index is None:
+            return False
+
+        # Backward shift on the stored hashes, as in HashTableCompact
+        slots, size = self.slots, self.table_size
+        hole = index
+        slots[2 * hole] = slots[2 * hole + 1] = 0
+        while True:
+            index = (index + 1) % size
+            if slots[2 * index + 1] == 0:
+                break
+            home = slots[2 * index] % size
+            if hole <= index:
+                stays = hole < home <= index
+            else:
+                stays = home > hole or home <= index
+            if not stays:
+                slots[2 * hole], slots[2 * hole + 1] = slots[2 * index], slots[2 * index + 1]
+                slots[2 * index] = slots[2 * index + 1] = 0
+                hole = index
+        self.count -= 1
+        self._write_counts()
+        return True
+
+    def load_factor(self):
+        return self.count / self.table_size
+
+    def resize(self, new_size=None):
+        # Rebuilds into a new file next to this one and swaps it in. Records are copied
+        # as raw bytes with their stored hashes, so nothing is rehashed or decoded, and
+        # superseded records are left behind.
+        self._check_writable()
+        start = time.perf_counter_ns()
+        new_size = new_size or self.table_size * 2
+        temp_path = self.path + ".resize"
+        self._write_empty(temp_path, new_size, self.hash_name, self.seed,
+                          heap_capacity=self.heap_end)
+        new = HashTableMapped(temp_path, writable=True)
+        for index in range(self.table_size):
+            offset = self.slots[2 * index + 1]
+            if offset:
+                start_of_key, key_length, value_length = self._record(offset)
+                record = self.mm[offset:start_of_key + key_length + value_length]
+                new._place(self.slots[2 * index], new._append(record))
+        new._write_counts()
+        new.close()
+        self.close()
+        os.replace(temp_path, self.path)
+        self._open()
+        self._record_resize(start)
+
+    def _hashed_items(self):
+        # (stored hash, key, value) for every live entry, in slot order
+        for index in range(self.table_size):
+            offset = self.slots[2 * index + 1]
+            if offset:
+                yield (self.slots[2 * index], _decode_key(self._key_at(offset)),
+                       self._value_at(offset))
+
+    def _lengths(self):
+        size = self.table_size
+        return "probe_lengths", [(index - self.slots[2 * index] % size) % size + 1
+                                 for index in range(size) if self.slots[2 * index + 1]]
+
+    def dump(self, path):
+        raise TypeError("HashTableMapped is already a file; copy it instead of dumping it")
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def benchmark_mapped(num_keys=200000):
+    # Startup cost: rebuilding an in-memory table key by key versus opening a mapped file
+    items = [(f"key{i}", i) for i in range(num_keys)]
+    keys = [key for key, _ in items]
+    print(f"\nMapped On-Disk Table ({num_keys} keys):")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.htmap")
+        start = time.perf_counter()
+        HashTableMapped.create(path, items).close()
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ht = HashTableCompact()
+        for key, value in items:
+            ht.insert(key, value)
+        rebuild_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with HashTableMapped(path) as mapped:
+            open_time = time.perf_counter() - start
+            start = time.perf_counter()
+            for key in keys:
+                mapped.search(key)
+            search_time = time.perf_counter() - start
+            size = os.path.getsize(path)
+        print(f"build file {build_time:.3f}s ({size / 2**20:.1f} MiB), "
+              f"rebuild in memory {rebuild_time:.3f}s, open mapped {open_time * 1000:.2f} ms")
+        print(f"mapped search {num_keys / search_time:,.0f} keys/sec")
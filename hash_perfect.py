@@ -0,0 +1,287 @@
+"""
+Minimal perfect hashing for static key sets, on top of HashTable_Rahul_Khanna.py.
+
+HashTablePerfect is built once from a known set of keys (from_items) and is read-only
+afterwards: every key gets a slot of its own, so a lookup is one displacement fetch and
+one slot probe, with no collisions to resolve.
+
+Command Line to Run Program:
+python3 hash_perfect.py
+"""
+
+import gc
+import time
+from array import array
+
+from HashTable_Rahul_Khanna import (
+    MASK64,
+    VECTOR_BATCH_MIN,
+    HashTable,
+    HashTableChaining,
+    HashTableCompact,
+    HashTableLinearProbing,
+    HashTableStrategy,
+    _gc_paused,
+    _vector_kernel,
+    get_hash_function,
+    hash_many,
+    np,
+)
+
+
+# ---------------------
+# Minimal Perfect Hashing (Static Key Sets)
+# ---------------------
+# Slot of a hash under displacement d: the displacement is mixed in, one multiply
+# scatters it, and the top 32 bits are scaled onto the table
+_PERFECT_XOR = 0x9E3779B97F4A7C15
+_PERFECT_MUL = 0xBF58476D1CE4E5B9
+_PERFECT_MAX_DISPLACEMENT = 1 << 16
+_PERFECT_READ_ONLY = ("HashTablePerfect is read-only; rebuild it with from_items() "
+                      "to change its contents")
+
+class HashTablePerfect(HashTableStrategy):
+    # Hash-and-displace (CHD) table for a key set that never changes. Keys are split into
+    # buckets of about bucket_size by hash; each bucket gets the first displacement that
+    # sends all of its keys to free slots, largest buckets first. A lookup reads its
+    # bucket's displacement and checks exactly one slot. The displacements are the only
+    # metadata, stored in the narrowest array type that holds them.
+    def __init__(self, items=(), hash_function=None, load_factor=0.9, bucket_size=2, seed=None):
+        if not 0 < load_factor <= 1:
+            raise ValueError(f"load_factor must be in (0, 1], got {load_factor}")
+        if bucket_size < 1:
+            raise ValueError(f"bucket_size must be at least 1, got {bucket_size}")
+        self.hash_function = get_hash_function(hash_function, seed)
+        self.bucket_size = bucket_size
+
+        # Later duplicates win, as with from_items()
+        latest = items if isinstance(items, dict) else dict(items)
+        self.count = len(latest)
+        self.table_size = max(1, round(self.count / load_factor))
+        self.num_buckets = max(1, -(-self.count // bucket_size))
+        if self.table_size >= 1 << 32:
+            raise ValueError("HashTablePerfect is limited to 2**32 slots")
+
+        start = time.perf_counter_ns()
+        with _gc_paused():
+            self._build(list(latest), list(latest.values()))
+        self.build_ns = time.perf_counter_ns() - start
+
+    @classmethod
+    def from_items(cls, items, **kwargs):
+        return cls(items, **kwargs)
+
+    def _build(self, keys, values):
+        size = self.table_size
+        hashes = self._bulk_hashes(keys) if keys else []
+        if isinstance(hashes, list):
+            hashes = [h & MASK64 for h in hashes]
+            if len(set(hashes)) < len(hashes):
+                raise ValueError("two keys share a full hash; a perfect table needs a "
+                                 "stronger hash_function")
+            displacements, slots = self._place_buckets(hashes)
+        else:
+            ordered = np.sort(hashes)
+            if (ordered[1:] == ordered[:-1]).any():
+                raise ValueError("two keys share a full hash; a perfect table needs a "
+                                 "stronger hash_function")
+            displacements, slots = self._place_buckets_many(hashes)
+
+        self.keys = [None] * size  # None marks an empty slot
+        self.values = [None] * size
+        for key, value, slot in zip(keys, values, slots):
+            self.keys[slot] = key
+            self.values[slot] = value
+
+        # Narrowest unsigned type that holds the largest displacement
+        largest = max(displacements, default=0)
+        typecode = next(code for code in "BH" if largest < 1 << (8 * array(code).itemsize))
+        self.displacements = array(typecode, displacements)
+
+    def _place_buckets(self, hashes):
+        # Greedy, largest bucket first: each takes the first displacement that lands all
+        # of its keys on free, distinct slots. Returns the displacements and every key's slot.
+        size, num_buckets = self.table_size, self.num_buckets
+        buckets = [[] for _ in range(num_buckets)]
+        for i, h in enumerate(hashes):
+            buckets[h % num_buckets].append(i)
+
+        displacements = [0] * num_buckets
+        key_slots = [0] * len(hashes)
+        taken = bytearray(size)
+        for b in sorted(range(num_buckets), key=lambda b: len(buckets[b]), reverse=True):
+            members = buckets[b]
+            if not members:
+                break
+            displacements[b], slots = self._displace([hashes[i] for i in members], taken)
+            for i, slot in zip(members, slots):
+                taken[slot] = 1
+                key_slots[i] = slot
+        return displacements, key_slots
+
+    def _displace(self, bucket_hashes, taken, first=0):
+        # First displacement from first on that lands the bucket on free, distinct slots
+        size = self.table_size
+        for d in range(first, _PERFECT_MAX_DISPLACEMENT):
+            mix = d * _PERFECT_XOR
+            slots = [((((h ^ mix) * _PERFECT_MUL & MASK64) >> 32) * size) >> 32
+                     for h in bucket_hashes]
+            if not any(taken[slot] for slot in slots) and len(set(slots)) == len(slots):
+                return d, slots
+        raise ValueError("no displacement fits; lower load_factor or bucket_size")
+
+    def _place_buckets_many(self, hashes):
+        # Vectorized: buckets of one size at a time, largest size first. Round d tries
+        # displacement d on every bucket of that size still waiting, and accepts those
+        # whose slots are free, distinct and claimed by no other bucket in the round.
+        size, num_buckets = self.table_size, self.num_buckets
+        bucket_of = hashes % np.uint64(num_buckets)
+        order = np.argsort(bucket_of, kind="stable")
+        lengths = np.bincount(bucket_of.astype(np.intp), minlength=num_buckets)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        displacements = np.zeros(num_buckets, dtype=np.int64)
+        key_slots = np.zeros(len(hashes), dtype=np.int64)
+        taken = np.zeros(size, dtype=bool)
+        mul, scale, shift = np.uint64(_PERFECT_MUL), np.uint64(size), np.uint64(32)
+        for k in range(int(lengths.max()), 0, -1):
+            waiting = np.flatnonzero(lengths == k)
+            members = order[starts[waiting][:, None] + np.arange(k)]  # one row per bucket
+            bucket_hashes = hashes[members]
+            for d in range(_PERFECT_MAX_DISPLACEMENT):
+                if len(waiting) <= 16:
+                    break  # a round costs the same for a handful of buckets as for thousands
+                mix = np.uint64(d * _PERFECT_XOR & MASK64)
+                slots = ((((bucket_hashes ^ mix) * mul) >> shift) * scale) >> shift
+                slots = slots.astype(np.intp)
+                ok = ~taken[slots].any(axis=1)
+                if k > 1:
+                    ordered = np.sort(slots, axis=1)
+                    ok &= (ordered[:, 1:] != ordered[:, :-1]).all(axis=1)
+                claimed, claims = np.unique(slots[ok], return_counts=True)
+                ok[ok] = ~np.isin(slots[ok], claimed[claims > 1]).any(axis=1)
+
+                taken[slots[ok].ravel()] = True
+                displacements[waiting[ok]] = d
+                key_slots[members[ok].ravel()] = slots[ok].ravel()
+                waiting, members, bucket_hashes = waiting[~ok], members[~ok], bucket_hashes[~ok]
+            else:
+                raise ValueError("no displacement fits; lower load_factor or bucket_size")
+
+            # The stragglers one at a time, from the displacement they had reached
+            for b, row, row_hashes in zip(waiting.tolist(), members.tolist(),
+                                          bucket_hashes.tolist()):
+                displacements[b], slots = self._displace(row_hashes, taken, d)
+                taken[slots] = True
+                key_slots[row] = slots
+        return displacements.tolist(), key_slots.tolist()
+
+    def search(self, key):
+        return self._search_hashed(key, self.hash_function(key))
+
+    def _search_hashed(self, key, h, default=None):
+        # One probe: a key outside the set lands on some slot and fails the comparison
+        h &= MASK64
+        mix = self.displacements[h % self.num_buckets] * _PERFECT_XOR
+        slot = ((((h ^ mix) * _PERFECT_MUL & MASK64) >> 32) * self.table_size) >> 32
+        return self.values[slot] if self.keys[slot] == key else default
+
+    def search_many(self, keys, default=None):
+        # With no probe loop, every slot can be computed up front in one vectorized pass
+        keys = list(keys)
+        if len(keys) < VECTOR_BATCH_MIN or _vector_kernel(self.hash_function) is None:
+            return super().search_many(keys, default)
+        hashes = hash_many(keys, self.hash_function)
+        mixes = np.asarray(self.displacements)[hashes % np.uint64(self.num_buckets)]
+        mixes = mixes.astype(np.uint64) * np.uint64(_PERFECT_XOR)
+        shift = np.uint64(32)
+        slots = ((((hashes ^ mixes) * np.uint64(_PERFECT_MUL)) >> shift)
+                 * np.uint64(self.table_size)) >> shift
+        stored_keys, values = self.keys, self.values
+        return [values[slot] if stored_keys[slot] == key else default
+                for key, slot in zip(keys, slots.tolist())]
+
+    def insert(self, key, value):
+        raise TypeError(_PERFECT_READ_ONLY)
+
+    def delete(self, key):
+        raise TypeError(_PERFECT_READ_ONLY)
+
+    def _insert_hashed(self, key, value, h):
+        raise TypeError(_PERFECT_READ_ONLY)
+
+    def _delete_hashed(self, key, h):
+        raise TypeError(_PERFECT_READ_ONLY)
+
+    def load_factor(self):
+        return self.count / self.table_size
+
+    def bits_per_key(self):
+        # Metadata only: the keys and values themselves are not counted
+        return 8 * self.displacements.itemsize * self.num_buckets / max(1, self.count)
+
+    def _hashed_items(self):
+        # Perfect entries keep no hash
+        for key, value in zip(self.keys, self.values):
+            if key is not None:
+                yield self.hash_function(key), key, value
+
+    def _lengths(self):
+        return "probe_lengths", [1] * self.count
+
+    def stats(self):
+        report = super().stats()
+        report["bits_per_key"] = self.bits_per_key()
+        report["build_ms"] = self.build_ns / 1e6
+        return report
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def benchmark_perfect(sizes=(100000, 1000000)):
+    # Static key set: one-shot builds of the general tables versus the perfect table,
+    # then a lookup of every key and of as many absent ones
+    for num_keys in sizes:
+        items = [(f"key{i}", i) for i in range(num_keys)]
+        keys = [key for key, _ in items]
+        misses = [f"miss{i}" for i in range(num_keys)]
+        print(f"\nStatic Key Set ({num_keys} keys):")
+        for strategy_class in (HashTableChaining, HashTableLinearProbing, HashTableCompact,
+                               HashTablePerfect):
+            gc.collect()
+            start = time.perf_counter()
+            ht = strategy_class.from_items(items)
+            build_time = time.perf_counter() - start
+            start = time.perf_counter()
+            assert ht.search_many(keys) == list(range(num_keys))
+            hit_time = time.perf_counter() - start
+            start = time.perf_counter()
+            ht.search_many(misses)
+            miss_time = time.perf_counter() - start
+            stats = ht.stats()
+            extra = (f", {ht.bits_per_key():.1f} bits/key" if isinstance(ht, HashTablePerfect)
+                     else "")
+            print(f"{strategy_class.__name__:>22}: build {build_time:.2f}s, "
+                  f"hits {hit_time:.2f}s, misses {miss_time:.2f}s, "
+                  f"max probe/chain {stats['max_length']}{extra}")
+            del ht
+
+
+# ---------------------
+# Demo
+# ---------------------
+def main():
+    print("Using Perfect Strategy")
+    ht_perfect = HashTable.from_items(HashTablePerfect, [("apple", 1), ("papel", 2), ("elppa", 3)])
+    print("Search papel:", ht_perfect.search("papel"))  # 2
+    print("Search pear:", ht_perfect.search("pear"))    # None
+    try:
+        ht_perfect.insert("pear", 4)
+    except TypeError as error:
+        print("Insert rejected:", error)
+    benchmark_perfect(sizes=(20000,))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""
+Asyncio key-value server in front of a HashTable from HashTable_Rahul_Khanna.py.
+
+Speaks a RESP-like protocol (a subset of Redis RESP2, so redis-cli works): a request is
+an array of bulk strings, e.g. *3\\r\\n$3\\r\\nSET\\r\\n$1\\r\\nk\\r\\n$1\\r\\nv\\r\\n.
+Commands: SET key value, GET key, DEL key, MSET key value [key value ...],
+MGET key [key ...], MDEL key [key ...], PING, STATS.
+Clients may pipeline any number of requests; replies come back in request order. A
+connection stops being read while its replies are not being read (backpressure).
+Includes a pipelining client and an async load generator reporting throughput and
+tail latency as the number of connections grows.
+
+Command Line to Run Program:
+python3 hash_server.py serve --port 6380
+python3 hash_server.py serve --unix /tmp/hashtable.sock
+python3 hash_server.py bench --connections 1 4 16 64 --pipeline 16
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import random
+import sys
+import time
+
+from HashTable_Rahul_Khanna import HashTable, HashTableChaining, percentile
+
+MAX_BULK_LENGTH = 64 * 1024 * 1024
+MAX_ARGUMENTS = 1024 * 1024
+WRITE_BUFFER_HIGH = 1 << 20  # stop reading a connection while this much output is queued
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class ResponseError(Exception):
+    # An -ERR reply received by the client
+    pass
+
+
+# ---------------------
+# Protocol
+# ---------------------
+def _to_wire(value):
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode("utf-8")
+
+
+def encode_request(args):
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = _to_wire(arg)
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def encode_reply(value):
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool) or isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(item) for item in value)
+    data = _to_wire(value)
+    return b"$%d\r\n%s\r\n" % (len(data), data)
+
+
+OK = b"+OK\r\n"
+
+
+def encode_error(message):
+    return b"-ERR %s\r\n" % message.encode("utf-8")
+
+
+async def read_request(reader):
+    # Returns the argument list, or None once the client has closed the connection
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Inline command (typed into telnet/nc): space-separated words
+        return line.split()
+    try:
+        count = int(line[1:])
+    except ValueError:
+        raise ProtocolError("invalid multibulk length")
+    if not 0 <= count <= MAX_ARGUMENTS:
+        raise ProtocolError("invalid multibulk length")
+    args = []
+    for _ in range(count):
+        header = await reader.readline()
+        if not header.startswith(b"$"):
+            raise ProtocolError("expected '$'")
+        try:
+            length = int(header[1:])
+        except ValueError:
+            raise ProtocolError("invalid bulk length")
+        if not 0 <= length <= MAX_BULK_LENGTH:
+            raise ProtocolError("invalid bulk length")
+        data = await reader.readexactly(length + 2)
+        args.append(data[:-2])
+    return args
+
+
+async def read_reply(reader):
+    line = await reader.readline()
+    if not line:
+        raise ConnectionResetError("server closed the connection")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode("utf-8")
+    if kind == b"-":
+        return ResponseError(body.decode("utf-8"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        return [await read_reply(reader) for _ in range(int(body))]
+    raise ProtocolError(f"unexpected reply {line!r}")
+
+
+# ---------------------
+# Server
+# ---------------------
+class HashTableServer:
+    # Every connection runs on one event loop, so the table never sees two operations at once
+    def __init__(self, table=None):
+        self.table = table or HashTable(HashTableChaining())
+        self.commands = {
+            b"SET": self._set, b"GET": self._get, b"DEL": self._del,
+            b"MSET": self._mset, b"MGET": self._mget, b"MDEL": self._mdel,
+            b"PING": self._ping, b"STATS": self._stats, b"COMMAND": self._command,
+        }
+        self.connections = 0
+        self.requests = 0
+
+    def execute(self, args):
+        if not args:
+            return encode_error("empty command")
+        command = self.commands.get(args[0].upper())
+        if command is None:
+            return encode_error(f"unknown command '{args[0].decode('utf-8', 'replace')}'")
+        self.requests += 1
+        try:
+            return command(args[1:])
+        except Exception as error:
+            # A table that rejects the operation (read-only, unsupported key type) answers
+            # with an error instead of dropping the connection
+            return encode_error(" ".join(f"{type(error).__name__}: {error}".split()))
+
+    def _set(self, args):
+        if len(args) != 2:
+            return encode_error("wrong number of arguments for 'SET'")
+        self.table.insert(args[0], args[1])
+        return OK
+
+    def _get(self, args):
+        if len(args) != 1:
+            return encode_error("wrong number of arguments for 'GET'")
+        return encode_reply(self.table.search(args[0]))
+
+    def _del(self, args):
+        # Like Redis DEL: the number of keys that were removed
+        if not args:
+            return encode_error("wrong number of arguments for 'DEL'")
+        return encode_reply(sum(self.table.delete_many(args)))
+
+    def _mset(self, args):
+        if not args or len(args) % 2:
+            return encode_error("wrong number of arguments for 'MSET'")
+        self.table.insert_many(zip(args[::2], args[1::2]))
+        return OK
+
+    def _mget(self, args):
+        if not args:
+            return encode_error("wrong number of arguments for 'MGET'")
+        return encode_reply(self.table.search_many(args))
+
+    def _mdel(self, args):
+        # One 0/1 per key, in request order
+        if not args:
+            return encode_error("wrong number of arguments for 'MDEL'")
+        return encode_reply([int(found) for found in self.table.delete_many(args)])
+
+    def _ping(self, args):
+        return b"+PONG\r\n"
+
+    def _stats(self, args):
+        stats = self.table.stats()
+        stats.update(connections=self.connections, requests=self.requests)
+        return encode_reply(json.dumps(stats))
+
+    def _command(self, args):
+        # redis-cli asks for the command table on connect; an empty list is enough
+        return encode_reply([])
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER_HIGH)
+        try:
+            while True:
+                args = await read_request(reader)
+                if args is None:
+                    break
+                # Pipelined requests are already in the reader's buffer, so this loop
+                # answers them back to back without waiting on the client
+                writer.write(self.execute(args))
+                # Backpressure: waits only while the client is not reading its replies
+                await writer.drain()
+        except ProtocolError as error:
+            writer.write(encode_error(f"Protocol error: {error}"))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=6380, path=None):
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host, port)
+
+
+# ---------------------
+# Client
+# ---------------------
+class HashTableClient:
+    # Pipelining client: requests are written as soon as they are made and replies are
+    # matched to them in order, so concurrent callers share one connection
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = collections.deque()
+        self.error = None  # set once replies stop coming; later calls fail with it
+        self.reply_task = asyncio.ensure_future(self._read_replies())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=6380, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _read_replies(self):
+        error = ConnectionResetError("client closed")
+        try:
+            while True:
+                reply = await read_reply(self.reader)
+                future = self.pending.popleft()
+                if future.cancelled():
+                    continue
+                if isinstance(reply, ResponseError):
+                    future.set_exception(reply)
+                else:
+                    future.set_result(reply)
+        except Exception as cause:
+            # Closed connection, malformed reply, reply nobody asked for: whatever it was,
+            # the replies still to come can no longer be matched to their requests
+            error = ConnectionResetError(f"{type(cause).__name__}: {cause}")
+            error.__cause__ = cause
+        finally:
+            self.error = error
+            while self.pending:
+                future = self.pending.popleft()
+                if not future.done():
+                    future.set_exception(error)
+
+    async def call(self, *args):
+        if self.error is not None:
+            raise self.error
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append(future)
+        self.writer.write(encode_request(args))
+        await self.writer.drain()
+        return await future
+
+    async def insert(self, key, value):
+        await self.call(b"SET", key, value)
+
+    async def search(self, key):
+        return await self.call(b"GET", key)
+
+    async def delete(self, key):
+        return bool(await self.call(b"DEL", key))
+
+    async def insert_many(self, items):
+        args = [b"MSET"]
+        for key, value in items:
+            args += [key, value]
+        await self.call(*args)
+
+    async def search_many(self, keys):
+        return await self.call(b"MGET", *keys)
+
+    async def delete_many(self, keys):
+        return [bool(found) for found in await self.call(b"MDEL", *keys)]
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.reply_task.cancel()
+
+
+# ---------------------
+# Load Generator
+# ---------------------
+async def run_load(connections, requests_per_connection=5000, pipeline=16, num_keys=10000,
+                   write_ratio=0.1, host="127.0.0.1", port=6380, path=None, seed=42):
+    # Each connection keeps `pipeline` requests in flight; returns throughput and latency
+    clients = [await HashTableClient.connect(host, port, path) for _ in range(connections)]
+    latencies = []
+    clock = time.perf_counter_ns
+
+    async def worker(client, rng, count):
+        for _ in range(count):
+            key = b"key%d" % rng.randrange(num_keys)
+            before = clock()
+            if rng.random() < write_ratio:
+                await client.insert(key, b"value")
+            else:
+                await client.search(key)
+            latencies.append(clock() - before)
+
+    per_worker = max(1, requests_per_connection // pipeline)
+    tasks = [worker(client, random.Random(seed + c * pipeline + w), per_worker)
+             for c, client in enumerate(clients) for w in range(pipeline)]
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    return {
+        "connections": connections,
+        "pipeline": pipeline,
+        "requests": len(latencies),
+        "requests_per_sec": len(latencies) / elapsed,
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "p999_us": percentile(latencies, 0.999) / 1000,
+    }
+
+
+async def bench(connection_counts=(1, 4, 16, 64), requests_per_connection=5000, pipeline=16,
+                num_keys=10000, host="127.0.0.1", port=0, path=None, external=False):
+    # Starts a server in this process unless pointed at an external one
+    server = None
+    if not external:
+        hash_server = HashTableServer()
+        hash_server.table.insert_many((b"key%d" % i, b"value") for i in range(num_keys))
+        server = await hash_server.start(host, port, path)
+        if path is None:
+            port = server.sockets[0].getsockname()[1]
+
+    print(f"Load test ({requests_per_connection} requests per connection, pipeline {pipeline}):")
+    results = []
+    for connections in connection_counts:
+        result = await run_load(connections, requests_per_connection, pipeline, num_keys,
+                                host=host, port=port, path=path)
+        results.append(result)
+        print(f"{connections:>4} connections: {result['requests_per_sec']:10,.0f} req/sec  "
+              f"p50 {result['p50_us']:8,.0f} us  p99 {result['p99_us']:8,.0f} us  "
+              f"p999 {result['p999_us']:8,.0f} us")
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a hash table over TCP or a Unix socket.")
+    sub = parser.add_subparsers(dest="mode", required=True)
+    serve_parser = sub.add_parser("serve", help="run the server")
+    bench_parser = sub.add_parser("bench", help="run the load generator")
+    for p in (serve_parser, bench_parser):
+        p.add_argument("--host", default="127.0.0.1")
+        p.add_argument("--port", type=int, default=6380)
+        p.add_argument("--unix", dest="path", help="Unix socket path instead of TCP")
+    bench_parser.add_argument("--connections", type=int, nargs="+", default=[1, 4, 16, 64])
+    bench_parser.add_argument("--requests", type=int, default=5000, help="requests per connection")
+    bench_parser.add_argument("--pipeline", type=int, default=16, help="requests in flight per connection")
+    bench_parser.add_argument("--keys", type=int, default=10000)
+    bench_parser.add_argument("--external", action="store_true",
+                              help="load an already running server instead of starting one")
+    args = parser.parse_args(argv)
+
+    if args.mode == "serve":
+        async def serve():
+            server = await HashTableServer().start(args.host, args.port, args.path)
+            print(f"Serving on {args.path or f'{args.host}:{args.port}'}")
+            async with server:
+                await server.serve_forever()
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+    else:
+        port = args.port if args.external else 0
+        asyncio.run(bench(args.connections, args.requests, args.pipeline, args.keys,
+                          args.host, port, args.path, args.external))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Sharded multi-process front-end for the strategies in HashTable_Rahul_Khanna.py.
+
+HashTableSharded partitions keys by hash across worker processes, each holding its own
+strategy instance, and batches requests per shard so bulk operations can use every core.
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+
+from HashTable_Rahul_Khanna import _MISSING, HashTableChaining, HashTableStrategy
+
+
+# ---------------------
+# Sharded Multi-Process Table
+# ---------------------
+# Replies are awaited in slices this long, with a check on the workers in between
+REPLY_POLL_SECONDS = 0.1
+
+
+def _shard_worker(strategy_class, strategy_kwargs, requests, results):
+    # Runs in a worker process: owns one strategy instance and serves batches until None
+    ht = strategy_class(**strategy_kwargs)
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+        seq, op, payload = request
+        try:
+            if op == "insert_many":
+                reply = ht.insert_many(payload)
+            elif op == "search_many":
+                reply = ht.search_many(payload, _MISSING)
+            elif op == "delete_many":
+                reply = ht.delete_many(payload)
+            else:
+                reply = ht.stats()
+        except Exception as error:  # handed back to the caller instead of killing the shard
+            reply = error
+        results.put((seq, reply))
+
+class HashTableSharded(HashTableStrategy):
+    # Partitions keys across num_shards worker processes, each holding its own strategy
+    # instance, so bulk operations use more than one core. Keys are routed with the
+    # built-in hash(): it is fast, only this process ever computes it, and it is
+    # independent of the shards' own hash function, so shards still fill every bucket.
+    # Batches are split per shard into chunks of batch_size and all chunks are queued
+    # before any reply is read (queues feed from background threads, so neither side
+    # blocks), then replies are put back in input order. Chunks for one shard are served
+    # in order, so repeated keys in a batch behave as they would in a single table.
+    # Single-key calls are a full round trip each: use the *_many methods for throughput.
+    # A call fails with RuntimeError as soon as a worker process is found dead, and with
+    # TimeoutError once it has waited more than timeout seconds (None waits as long as
+    # the workers live); replies that arrive after a timeout are discarded.
+    def __init__(self, num_shards=None, strategy_class=None, batch_size=10000, timeout=None,
+                 **strategy_kwargs):
+        self.num_shards = num_shards or os.cpu_count() or 1
+        self.strategy_class = strategy_class or HashTableChaining
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.next_seq = 0
+        self.results = multiprocessing.Queue()
+        self.requests = [multiprocessing.Queue() for _ in range(self.num_shards)]
+        self.workers = [multiprocessing.Process(
+                            target=_shard_worker,
+                            args=(self.strategy_class, strategy_kwargs, requests, self.results),
+                            daemon=True)
+                        for requests in self.requests]
+        for worker in self.workers:
+            worker.start()
+
+    def _dispatch(self, op, payload, keys):
+        # Returns (input positions, reply) for every chunk sent
+        per_shard = [[] for _ in range(self.num_shards)]
+        for position, key in enumerate(keys):
+            per_shard[hash(key) % self.num_shards].append(position)
+
+        pending = {}
+        for shard, positions in enumerate(per_shard):
+            for start in range(0, len(positions), self.batch_size):
+                chunk = positions[start:start + self.batch_size]
+                self.requests[shard].put((self.next_seq, op, [payload[i] for i in chunk]))
+                pending[self.next_seq] = chunk
+                self.next_seq += 1
+        return self._collect(pending)
+
+    def _collect(self, pending):
+        # Returns (pending[seq], reply) for every request in pending. Every reply is
+        # drained before a shard's error is raised, so none is left in the queue.
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        replies, errors = [], []
+        while pending:
+            try:
+                seq, reply = self.results.get(timeout=REPLY_POLL_SECONDS)
+            except queue.Empty:
+                self._check_workers(deadline)
+                continue
+            if seq not in pending:
+                continue  # a late reply to a call that timed out
+            if isinstance(reply, Exception):
+                errors.append(reply)
+            replies.append((pending.pop(seq), reply))
+        if errors:
+            raise errors[0]
+        return replies
+
+    def _check_workers(self, deadline):
+        if not self.workers:
+            raise RuntimeError("HashTableSharded is closed")
+        dead = [shard for shard, worker in enumerate(self.workers) if not worker.is_alive()]
+        if dead:
+            raise RuntimeError(f"shard worker(s) {dead} exited; their entries are lost")
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"no reply from the shards within {self.timeout} seconds")
+
+    def insert(self, key, value):
+        self.insert_many([(key, value)])
+
+    def search(self, key):
+        return self.search_many([key])[0]
+
+    def delete(self, key):
+        if not self.delete_many([key])[0]:
+            print(f"Key '{key}' not found in sharded table.")
+
+    def _search_hashed(self, key, h, default=None):
+        return self.search_many([key], default)[0]
+
+    def _delete_hashed(self, key, h):
+        return self.delete_many([key])[0]
+
+    def insert_many(self, items):
+        items = list(items)
+        self._dispatch("insert_many", items, [key for key, _ in items])
+
+    def search_many(self, keys, default=None):
+        # Shards answer misses with _MISSING, which is swapped for default here
+        keys = list(keys)
+        results = [default] * len(keys)
+        for positions, reply in self._dispatch("search_many", keys, keys):
+            for position, value in zip(positions, reply):
+                results[position] = default if value is _MISSING else value
+        return results
+
+    def delete_many(self, keys):
+        keys = list(keys)
+        results = [False] * len(keys)
+        for positions, reply in self._dispatch("delete_many", keys, keys):
+            for position, found in zip(positions, reply):
+                results[position] = found
+        return results
+
+    def stats(self):
+        # One stats() report per shard, plus the totals
+        pending = {}
+        for shard, requests in enumerate(self.requests):
+            requests.put((self.next_seq, "stats", None))
+            pending[self.next_seq] = shard
+            self.next_seq += 1
+        shards = [report for _, report in sorted(self._collect(pending))]
+        return {
+            "strategy": type(self).__name__,
+            "num_shards": self.num_shards,
+            "entries": sum(shard["entries"] for shard in shards),
+            "shards": shards,
+        }
+
+    def close(self):
+        # Stops the workers; the table is unusable afterwards. A worker that died may have
+        # left the shared reply queue locked, so then the rest are terminated, not joined.
+        crashed = any(not worker.is_alive() for worker in self.workers)
+        for requests in self.requests:
+            requests.put(None)
+        for worker in self.workers:
+            if crashed:
+                worker.terminate()
+            worker.join()
+        self.workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def dump(self, path):
+        raise TypeError("HashTableSharded keeps its entries in worker processes; "
+                        "snapshot each shard's strategy instead")
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def benchmark_sharded(num_keys=200000, shard_counts=(1, 2, 4)):
+    # Bulk insert_many/search_many in one process versus spread over worker processes
+    items = [(f"key{i}", i) for i in range(num_keys)]
+    keys = [key for key, _ in items]
+    print(f"\nSharded Bulk Operations ({num_keys} keys, {os.cpu_count()} cores):")
+
+    ht = HashTableChaining()
+    start = time.perf_counter()
+    ht.insert_many(items)
+    insert_time = time.perf_counter() - start
+    start = time.perf_counter()
+    ht.search_many(keys)
+    search_time = time.perf_counter() - start
+    print(f"{'in-process':>12}: insert {num_keys / insert_time:12,.0f} keys/sec, "
+          f"search {num_keys / search_time:12,.0f} keys/sec")
+
+    for num_shards in shard_counts:
+        with HashTableSharded(num_shards=num_shards) as sharded:
+            start = time.perf_counter()
+            sharded.insert_many(items)
+            insert_time = time.perf_counter() - start
+            start = time.perf_counter()
+            found = sharded.search_many(keys)
+            search_time = time.perf_counter() - start
+        assert found == list(range(num_keys))
+        print(f"{num_shards:>3} shard(s): insert {num_keys / insert_time:12,.0f} keys/sec, "
+              f"search {num_keys / search_time:12,.0f} keys/sec")
@@ -0,0 +1,90 @@
+import io
+import itertools
+import random
+
+from HashTable_Rahul_Khanna import STRATEGIES, HashTableStrategy
+
+# Permutations of one word share every legacy hash, so they fight over the same
+# candidate slots and stash
+ANAGRAMS = ["".join(p) for p in itertools.permutations("abcd")]
+
+# Direct addressing drops a key whenever another one lands on its slot, by design, so
+# it is the one strategy that cannot match a dict
+EXACT_STRATEGIES = {name: factory for name, factory in STRATEGIES.items() if name != "direct"}
+
+
+# ---------------------
+# Model Tests Against a dict
+# ---------------------
+# Random single-key and batched operations go to the table and to a dict, and every
+# answer must agree. Pools are small so keys are updated, deleted and re-inserted often,
+# and batches repeat keys to pin down their ordering rules. Phases alternate between
+# filling and draining, so every table keeps going through its grow and shrink paths.
+def key_pool(seed, size=300):
+    rng = random.Random(seed)
+    return [f"key{rng.getrandbits(24):06x}" for _ in range(size)]
+
+
+def snapshot(ht):
+    buffer = io.BytesIO()
+    ht.dump(buffer)
+    buffer.seek(0)
+    return HashTableStrategy.load(buffer)
+
+
+def run_model(ht, pool, seed=0, steps=3000, batches=True, check=None, reload=None):
+    # Returns the table (reload may replace it) and the dict it must match
+    rng = random.Random(seed)
+    ref = {}
+    for step in range(steps):
+        draining = (step // 750) % 2 == 1
+        roll = rng.random()
+        key = rng.choice(pool)
+        if not batches and roll >= 0.8:
+            roll -= 0.8
+        if roll < 0.35 and not draining:
+            value = rng.randrange(1000)
+            ht.insert(key, value)
+            ref[key] = value
+        elif roll < 0.55:
+            ht.delete(key)
+            ref.pop(key, None)
+        elif roll < 0.8:
+            assert ht.search(key) == ref.get(key), (step, key)
+        elif roll < 0.87 and not draining:
+            items = [(rng.choice(pool), rng.randrange(1000)) for _ in range(rng.randrange(1, 50))]
+            ht.insert_many(items)
+            ref.update(items)  # a repeated key keeps its last value
+        elif 0.87 <= roll < 0.94:
+            keys = [rng.choice(pool) for _ in range(rng.randrange(1, 50))]
+            assert ht.search_many(keys) == [ref.get(k) for k in keys], step
+        else:
+            keys = [rng.choice(pool) for _ in range(rng.randrange(1, 50))]
+            # Only the first of repeated keys finds anything to delete
+            expected = [ref.pop(k, None) is not None for k in keys]
+            assert ht.delete_many(keys) == expected, step
+        if check is not None:
+            check(ht, step)
+        if reload is not None and step % 500 == 499:
+            ht = reload(ht)
+    if batches:
+        assert ht.search_many(pool) == [ref.get(k) for k in pool]
+    else:
+        assert [ht.search(k) for k in pool] == [ref.get(k) for k in pool]
+    return ht, ref
+
+
+def run_checked_model(ht, pool, seed=0, check=None, every=25, **kwargs):
+    # run_model() that also checks a table invariant every few steps and records
+    # whether an incremental migration was in progress at each one
+    migrating = []
+
+    def observe(ht, step):
+        if check is not None and step % every == 0:
+            check(ht)
+        migrating.append(getattr(ht, "old_table", None) is not None)
+
+    ht, ref = run_model(ht, pool, seed=seed, check=observe, **kwargs)
+    assert dict(ht.items()) == ref
+    assert ht.count == len(ref)
+    return ht, ref, any(migrating)
@@ -0,0 +1,136 @@
+from HashTable_Rahul_Khanna import (
+    ADAPTIVE_COSTS,
+    ADAPTIVE_PHASES,
+    ADAPTIVE_POLICY,
+    ADAPTIVE_STRATEGIES,
+    AdaptiveHashTable,
+    HashTableChaining,
+    HashTableLinearProbing,
+    adaptive_policy,
+    calibrate_adaptive_costs,
+)
+from model import key_pool, run_model
+
+
+def test_adaptive_matches_dict():
+    ht = AdaptiveHashTable(window=64, patience=1, migrate_step=4)
+    ht, ref = run_model(ht, key_pool(3), seed=4, steps=6000)
+    assert dict(ht.items()) == ref
+    assert ht.stats()["adaptive"]["migrations"] > 0
+
+
+# ---------------------
+# Adaptive Migration Decisions
+# ---------------------
+def test_adaptive_migrates_only_when_it_pays():
+    ht = AdaptiveHashTable("compact", window=256, patience=1, migrate_step=64)
+    for i in range(5000):
+        ht.insert(f"key{i}", i)
+    # The load policy's strategy inserts a little faster, never enough to repay a copy
+    assert ht.stats()["adaptive"]["phase"] == "load"
+    assert ht.migrations == 0
+    for i in range(2000):
+        ht.delete(f"key{i}")
+        ht.insert(f"churn{i}", i)
+    # Early in a churn phase the saving does not cover copying 5000 entries yet
+    assert ht.migrations == 0
+    for i in range(2000, 20000):
+        ht.delete(f"key{i}" if i < 5000 else f"churn{i - 5000}")
+        ht.insert(f"churn{i}", i)
+    assert ht.migrations == 1
+    assert ht.strategy_name == ADAPTIVE_POLICY["churn"]
+
+
+def test_adaptive_phase_hysteresis():
+    ht = AdaptiveHashTable("compact", window=200, patience=1)
+    for i in range(2000):
+        ht.insert(f"key{i}", i)
+        ht.delete(f"key{i}")
+    assert ht.phase == "churn"
+    # One delete in seven operations would not start a churn phase, but it holds one
+    for i in range(2000):
+        ht.insert(f"key{i}", i)
+        ht.search(f"key{i}")
+        ht.search(f"key{i}")
+        if i % 2:
+            ht.delete(f"key{i}")
+        assert ht.phase == "churn"
+    for i in range(0, 2000, 2):
+        ht.search(f"key{i}")
+    assert ht.phase == "read"
+
+
+def test_migration_holds_shrinking_and_freezes_the_old_table():
+    # The caller's own instance has no cost figures, so the first window starts a move
+    ht = AdaptiveHashTable(HashTableLinearProbing(rehash_step=1), window=64, patience=1,
+                           migrate_step=1, policy=dict.fromkeys(ADAPTIVE_PHASES, "chaining"))
+    i = 0
+    while ht.old is None:
+        ht.insert(f"key{i}", i)
+        i += 1
+    old, target = ht.old, ht.strategy
+    assert target.min_load_factor is None and old.rehash_step == 0
+    ht.finish_migration()
+    assert target.min_load_factor == HashTableChaining().min_load_factor
+    assert not hasattr(ht, "min_load_factor")
+    assert dict(ht.items()) == {f"key{j}": j for j in range(i)}
+
+
+# ---------------------
+# Costs
+# ---------------------
+def test_default_policy_follows_the_costs():
+    assert ADAPTIVE_POLICY == adaptive_policy(ADAPTIVE_COSTS)
+    cheap_reads = {"compact": dict(ADAPTIVE_COSTS["compact"], read=1)}
+    ht = AdaptiveHashTable(costs=cheap_reads)
+    assert ht.policy["read"] == "compact"
+    assert ht.policy["load"] == ADAPTIVE_POLICY["load"]
+    assert ht.costs["compact"]["read"] == 1
+
+
+def test_calibration_measures_every_strategy_and_phase():
+    costs = calibrate_adaptive_costs(num_keys=200, repeat=1)
+    assert set(costs) == set(ADAPTIVE_STRATEGIES)
+    for name, phases in costs.items():
+        assert set(phases) == {*ADAPTIVE_PHASES, "move"}
+        assert all(ns > 0 for ns in phases.values()), name
+    # Kept for the rest of the process, and callers get their own copy
+    costs["compact"]["read"] = -1
+    assert calibrate_adaptive_costs(num_keys=200, repeat=1)["compact"]["read"] > 0
+
+
+def test_calibrated_table_uses_measured_costs():
+    ht = AdaptiveHashTable(costs="calibrate")
+    assert ht.costs == calibrate_adaptive_costs()
+    assert ht.policy == adaptive_policy(ht.costs)
+
+
+# ---------------------
+# Strategy Hooks
+# ---------------------
+def test_shrink_holds_nest():
+    ht = HashTableLinearProbing(table_size=8, min_load_factor=0.25)
+    ht.hold_shrinking()
+    ht.insert_many([(f"key{i}", i) for i in range(100)])  # a batch's own hold nests inside
+    size = ht.table_size
+    assert ht.delete_many([f"key{i}" for i in range(100)]) == [True] * 100
+    assert ht.min_load_factor is None and ht.table_size == size
+    ht.release_shrinking()
+    assert ht.min_load_factor == 0.25
+    ht.insert("key0", 0)
+    ht.delete("key0")
+    assert ht.table_size < size
+
+
+def test_freeze_stops_an_incremental_rehash():
+    ht = HashTableChaining(table_size=8, rehash_step=1)
+    i = 0
+    while ht.old_table is None:
+        ht.insert(f"key{i}", i)
+        i += 1
+    ht.freeze()
+    index = ht.rehash_index
+    items = list(ht._hashed_items())
+    assert ht.search_many([f"key{j}" for j in range(i)]) == list(range(i))
+    assert ht.rehash_index == index
+    assert list(ht._hashed_items()) == items
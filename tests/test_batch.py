@@ -0,0 +1,57 @@
+import pytest
+
+from HashTable_Rahul_Khanna import STRATEGIES, HashTable, HashTableChaining, fnv1a_hash
+from model import EXACT_STRATEGIES
+
+
+# ---------------------
+# Batch Ordering
+# ---------------------
+@pytest.mark.parametrize("strategy", list(EXACT_STRATEGIES))
+def test_batch_results_follow_input_order(strategy):
+    ht = EXACT_STRATEGIES[strategy](None)
+    keys = [f"key{i}" for i in range(600)]  # above the vectorized batch threshold
+    ht.insert_many([(key, i) for i, key in enumerate(keys)] + [("key5", "last")])
+    values = list(range(600))
+    values[5] = "last"  # the later duplicate in the batch wins
+    queries = keys[::-1] + ["missing", "key5", "key5"]
+    assert ht.search_many(queries) == values[::-1] + [None, "last", "last"]
+    assert ht.delete_many(["key1", "missing", "key1", "key2"]) == [True, False, False, True]
+    assert ht.search_many(["key0", "key1", "key2", "key3"]) == [0, None, None, 3]
+
+
+def test_batches_hash_each_key_once():
+    calls = []
+
+    def counting_hash(key):
+        calls.append(key)
+        return fnv1a_hash(key)
+
+    ht = HashTableChaining(table_size=2048, hash_function=counting_hash)
+    keys = [f"key{i}" for i in range(100)]
+    ht.insert_many([(key, i) for i, key in enumerate(keys)])
+    assert ht.search_many(keys) == list(range(100))
+    assert ht.delete_many(keys[:50]) == [True] * 50
+    assert len(calls) == 250
+
+
+@pytest.mark.parametrize("prefilter", [None, "bloom"])
+def test_facade_batches(prefilter):
+    ht = HashTable(HashTableChaining(), prefilter=prefilter)
+    ht.insert_many([("apple", 1), ("pear", 2), ("apple", 3)])
+    assert ht.search_many(["pear", "plum", "apple"]) == [2, None, 3]
+    assert ht.delete_many(["apple", "apple", "plum"]) == [True, False, False]
+    assert dict(ht.items()) == {"pear": 2}
+
+
+# ---------------------
+# Keys Stored With None
+# ---------------------
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_none_value_is_not_a_miss(strategy):
+    ht = STRATEGIES[strategy](None)
+    ht.insert_many([("apple", None), ("pear", 1)])
+    sentinel = object()
+    assert ht.search_many(["apple", "plum"], sentinel) == [None, sentinel]
+    assert ht.delete_many(["apple", "plum"]) == [True, False]
+    assert dict(ht.items()) == {"pear": 1}
@@ -0,0 +1,60 @@
+import json
+import random
+
+import pytest
+
+import hash_benchmark
+from HashTable_Rahul_Khanna import percentile
+
+
+@pytest.mark.parametrize("workload", list(hash_benchmark.WORKLOADS))
+def test_workloads_are_reproducible(workload):
+    make = hash_benchmark.WORKLOADS[workload]
+    preload, ops = make(200, random.Random(1))
+    assert (preload, ops) == make(200, random.Random(1))
+    assert ops and all(op in ("insert", "search", "delete") for op, _, _ in ops)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 51
+    assert percentile(values, 0.99) == 100
+    assert percentile([7], 0.999) == 7
+
+
+def test_run_benchmark_reports_throughput_and_latency():
+    result = hash_benchmark.run_benchmark("chaining", "hit_miss", num_ops=200, repeat=2)
+    assert result["ops"] > 0 and result["ops_per_sec"] > 0
+    assert result["p50_ns"] <= result["p99_ns"] <= result["p999_ns"]
+    assert result["peak_memory_bytes"] > 0
+    assert set(result["by_op"]) <= {"insert", "search", "delete"}
+
+
+def test_compare_flags_regressions(capsys):
+    def suite(ops_per_sec, p99_ns):
+        return {"results": [{"strategy": "chaining", "workload": "uniform",
+                             "ops_per_sec": ops_per_sec, "p99_ns": p99_ns}]}
+
+    assert hash_benchmark.compare(suite(1000, 100), suite(1000, 100)) == []
+    assert hash_benchmark.compare(suite(850, 100), suite(1000, 100))  # throughput drop
+    assert hash_benchmark.compare(suite(1000, 120), suite(1000, 100))  # tail latency rise
+    assert hash_benchmark.compare(suite(950, 105), suite(1000, 100)) == []  # within 10%
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_cli_writes_and_compares_json(tmp_path, capsys):
+    path = str(tmp_path / "results.json")
+    argv = ["--strategies", "compact", "--workloads", "sequential", "--ops", "100",
+            "--repeat", "1", "--warmup", "0"]
+    assert hash_benchmark.main(argv + ["--json", path]) == 0
+    with open(path) as f:
+        saved = json.load(f)
+    assert [(r["strategy"], r["workload"]) for r in saved["results"]] == [
+        ("compact", "sequential")]
+    # A baseline a thousand times faster makes this run a regression
+    for result in saved["results"]:
+        result["ops_per_sec"] *= 1000
+    with open(path, "w") as f:
+        json.dump(saved, f)
+    assert hash_benchmark.main(argv + ["--compare", path]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
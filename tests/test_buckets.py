@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from HashTable_Rahul_Khanna import BUCKET_TYPES, HashTableChaining
+
+
+# ---------------------
+# Chaining Buckets
+# ---------------------
+@pytest.mark.parametrize("bucket_type", sorted(BUCKET_TYPES))
+def test_bucket_matches_dict(bucket_type):
+    # Few distinct hashes, so keys share a hash and only the key comparison tells them
+    # apart; enough keys that the array bucket spills past its two inline slots
+    rng = random.Random(17)
+    bucket = BUCKET_TYPES[bucket_type]()
+    ref = {}
+    for step in range(3000):
+        key = f"key{rng.randrange(12)}"
+        h = int(key[3:]) % 3
+        roll = rng.random()
+        if roll < 0.4:
+            length = bucket.insert(key, step, h)
+            assert length == (False if key in ref else len(ref) + 1)
+            ref[key] = step
+        elif roll < 0.7:
+            assert bucket.delete(key, h) == (ref.pop(key, None) is not None)
+        else:
+            assert bucket.search(key, h, "missing") == ref.get(key, "missing")
+        assert len(bucket) == len(ref)
+    assert {key: value for _, key, value in bucket.entries()} == ref
+    assert all(h == int(key[3:]) % 3 for h, key, _ in bucket.entries())
+
+
+def test_unknown_bucket_type_is_rejected():
+    with pytest.raises(ValueError, match="bucket_type"):
+        HashTableChaining(bucket_type="deque")
+
+
+def test_bucket_types_agree_on_a_crowded_table():
+    items = [(f"key{i}", i) for i in range(500)]
+    # No resizing and no trees, so every chain is about 125 entries long
+    tables = [HashTableChaining(table_size=4, max_load_factor=None, treeify_threshold=None,
+                                bucket_type=bucket_type)
+              for bucket_type in ("linked_list", "array")]
+    for ht in tables:
+        ht.insert_many(items)
+        ht.delete_many([f"key{i}" for i in range(0, 500, 3)])
+    linked, array = (dict(ht.items()) for ht in tables)
+    assert linked == array
+    assert tables[0].stats()["chain_lengths"] == tables[1].stats()["chain_lengths"]
@@ -0,0 +1,72 @@
+import pytest
+
+from HashTable_Rahul_Khanna import (
+    HashTable,
+    HashTableChaining,
+    HashTableCompact,
+    HashTableCuckoo,
+    HashTableLinearProbing,
+    HashTableRobinHood,
+    HashTableSwiss,
+    VECTOR_BATCH_MIN,
+    np,
+)
+from model import key_pool, run_model
+from test_compact import check_compact
+from test_robin_hood import check_robin_hood
+from test_swiss import check_swiss
+
+BUILDS = {
+    "chaining": (HashTableChaining, {}),
+    "chaining_array": (HashTableChaining, {"bucket_type": "array"}),
+    "linear_probing": (HashTableLinearProbing, {}),
+    "robin_hood": (HashTableRobinHood, {}),
+    "compact": (HashTableCompact, {}),
+    "cuckoo": (HashTableCuckoo, {"rng_seed": 0}),
+}
+if np is not None:
+    BUILDS["swiss"] = (HashTableSwiss, {})
+
+CHECKS = {HashTableCompact: check_compact, HashTableRobinHood: check_robin_hood,
+          HashTableSwiss: check_swiss}
+
+
+# ---------------------
+# One-Shot Build
+# ---------------------
+@pytest.mark.parametrize("num_keys", [VECTOR_BATCH_MIN // 4, VECTOR_BATCH_MIN * 20])
+@pytest.mark.parametrize("build", list(BUILDS))
+def test_from_items_matches_dict(build, num_keys):
+    strategy_class, kwargs = BUILDS[build]
+    pool = key_pool(20, size=num_keys)
+    items = [(key, i) for i, key in enumerate(pool)] + [(pool[0], -1)]
+    ht = strategy_class.from_items(items, **kwargs)
+    ref = dict(items)  # a repeated key keeps its later value
+    assert ht.count == len(ref)
+    assert ht.resizes <= 1  # at most the reserve() before placing anything
+    assert dict(ht.items()) == ref
+    assert ht.search_many(pool) == [ref[key] for key in pool]
+    if type(ht) in CHECKS:
+        CHECKS[type(ht)](ht)
+    # The built layout supports deletes, and the emptied table keeps working
+    assert ht.delete_many(list(ref)) == [True] * len(ref)
+    run_model(ht, pool[:300], seed=num_keys, steps=1500)
+
+
+@pytest.mark.parametrize("strategy_class", [HashTableLinearProbing, HashTableRobinHood,
+                                            HashTableCompact])
+def test_entries_that_run_off_the_end_wrap_around(strategy_class):
+    # Every key's home is the last slot, so all but one must wrap to the front
+    ht = strategy_class.from_items({key: i for i, key in enumerate("abcde")}, table_size=8,
+                                   hash_function=lambda key: 7)
+    assert ht.table_size == 8
+    assert ht.search_many(list("abcdef")) == [0, 1, 2, 3, 4, None]
+    if strategy_class in CHECKS:
+        CHECKS[strategy_class](ht)
+
+
+def test_facade_from_items_with_prefilter():
+    ht = HashTable.from_items(HashTableLinearProbing, [("apple", 1), ("pear", None)],
+                              prefilter="bloom")
+    assert ht.search_many(["apple", "pear", "plum"]) == [1, None, None]
+    assert ht.stats()["prefilter"]["filtered"] >= 1
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from HashTable_Rahul_Khanna import bucket_indices, get_hash_function, hash_many  # noqa: E402
+
+# Every length from empty to past several 8-byte words, non-ASCII text and bytes
+RNG = random.Random(18)
+KEYS = ([f"key{i}" for i in range(300)]
+        + ["x" * n for n in range(40)]
+        + ["ключ", "clé", "键", "🔑" * 3]
+        + [bytes(RNG.randrange(256) for _ in range(n)) for n in range(20)])
+
+
+@pytest.mark.parametrize("name,seed", [("legacy", None), ("fnv1a", None), ("murmur", None),
+                                       ("murmur", 12345), ("siphash", None),
+                                       ("siphash", (1 << 127) + 99), ("python", None)])
+def test_hash_many_equals_the_scalar_hash(name, seed):
+    hash_function = get_hash_function(name, seed)
+    expected = [hash_function(key) for key in KEYS]
+    assert hash_many(KEYS, name, seed).tolist() == expected
+    # Small chunks give every chunk its own packed buffer and length ordering
+    assert hash_many(KEYS, name, seed, chunk_size=7).tolist() == expected
+
+
+def test_hash_many_takes_a_callable_and_any_iterable():
+    hashes = hash_many(iter(["apple", "pear"]), len)
+    assert hashes.dtype == np.uint64 and hashes.tolist() == [5, 4]
+    assert hash_many([]).tolist() == []
+
+
+def test_bucket_indices():
+    indices = bucket_indices(KEYS, 11, "fnv1a")
+    assert indices.tolist() == [get_hash_function("fnv1a")(key) % 11 for key in KEYS]
@@ -0,0 +1,111 @@
+import pytest
+
+from hash_cache import CACHE_POLICIES, HashTableCache
+from model import key_pool, run_model
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("policy", CACHE_POLICIES)
+def test_cache_below_capacity_matches_dict(policy):
+    run_model(HashTableCache(max_entries=1000, policy=policy), key_pool(6), seed=7, batches=False)
+
+
+def test_bad_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        HashTableCache(max_entries=10, policy="fifo")
+    with pytest.raises(ValueError):
+        HashTableCache()
+
+
+# ---------------------
+# Eviction Policies
+# ---------------------
+def test_lru_evicts_least_recently_used():
+    cache = HashTableCache(max_entries=3)
+    for key in "abc":
+        cache.insert(key, key)
+    cache.search("a")
+    cache.insert("d", "d")
+    assert cache.search("b") is None
+    assert [cache.search(key) for key in "acd"] == ["a", "c", "d"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_clock_gives_referenced_entries_a_second_chance():
+    cache = HashTableCache(max_entries=3, policy="clock")
+    for key in "abc":
+        cache.insert(key, key)
+    cache.search("a")
+    cache.insert("d", "d")  # a is oldest but referenced, so b goes
+    assert cache.search("b") is None
+    assert [cache.search(key) for key in "acd"] == ["a", "c", "d"]
+
+
+def test_s3fifo_resists_scans():
+    cache = HashTableCache(max_entries=100, policy="s3fifo")
+    hot = [f"hot{i}" for i in range(50)]
+    for _ in range(3):
+        for key in hot:
+            if cache.search(key) is None:
+                cache.insert(key, key)
+    # One-off keys pass through the small queue without pushing the hot set out of main
+    for i in range(1000):
+        cache.insert(f"scan{i}", i)
+    assert [cache.search(key) for key in hot] == hot
+    assert len(cache) == 100
+
+
+def test_lru_is_flushed_by_the_same_scan():
+    cache = HashTableCache(max_entries=100)
+    hot = [f"hot{i}" for i in range(50)]
+    for key in hot:
+        cache.insert(key, key)
+        cache.search(key)
+    for i in range(1000):
+        cache.insert(f"scan{i}", i)
+    assert all(cache.search(key) is None for key in hot)
+
+
+@pytest.mark.parametrize("policy", CACHE_POLICIES)
+def test_max_bytes_bounds_the_charged_size(policy):
+    cache = HashTableCache(max_bytes=100, policy=policy, sizeof=lambda key, value: len(value))
+    for i in range(50):
+        cache.insert(f"key{i}", "x" * (i % 7 + 1))
+        assert cache.bytes <= 100
+    cache.insert("big", "x" * 101)  # larger than the cache: evicts everything, itself included
+    assert len(cache) == 0 and cache.bytes == 0
+
+
+# ---------------------
+# Expiry
+# ---------------------
+def test_ttl_expires_lazily_on_lookup():
+    clock = FakeClock()
+    cache = HashTableCache(max_entries=10, default_ttl=5, clock=clock)
+    cache.insert("apple", 1)
+    cache.insert("pear", 2, ttl=20)
+    clock.now = 10
+    assert cache.search("apple") is None
+    assert cache.search("pear") == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_expire_drops_unread_entries_and_skips_updated_deadlines():
+    clock = FakeClock()
+    cache = HashTableCache(max_entries=100, clock=clock, expire_interval=10)
+    for i in range(20):
+        cache.insert(f"key{i}", i, ttl=5)
+    cache.insert("key0", 0, ttl=50)  # the update supersedes key0's first deadline
+    clock.now = 10
+    for i in range(10):
+        cache.search("key0")  # one of these operations runs expire()
+    assert len(cache) == 1
+    assert cache.expirations == 19
+    assert cache.search("key0") == 0
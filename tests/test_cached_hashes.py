@@ -0,0 +1,93 @@
+import pytest
+
+from HashTable_Rahul_Khanna import (
+    HashTableChaining,
+    HashTableCompact,
+    HashTableCuckoo,
+    HashTableLinearProbing,
+    HashTableRobinHood,
+    HashTableSwiss,
+    fnv1a_hash,
+    np,
+)
+
+
+class CountingHash:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, key):
+        self.calls += 1
+        return fnv1a_hash(key)
+
+
+class CountingKey:
+    # Key whose equality is expensive enough to count
+    comparisons = 0
+
+    def __init__(self, name, h):
+        self.name = name
+        self.h = h
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return isinstance(other, CountingKey) and self.name == other.name
+
+    def __hash__(self):
+        return self.h
+
+
+TABLES = {
+    "chaining": lambda h: HashTableChaining(hash_function=h),
+    "chaining_array": lambda h: HashTableChaining(hash_function=h, bucket_type="array"),
+    "linear_probing": lambda h: HashTableLinearProbing(hash_function=h),
+    "robin_hood": lambda h: HashTableRobinHood(hash_function=h),
+    "cuckoo": lambda h: HashTableCuckoo(hash_function=h),
+    "compact": lambda h: HashTableCompact(hash_function=h),
+}
+if np is not None:
+    TABLES["swiss"] = lambda h: HashTableSwiss(hash_function=h)
+
+
+# ---------------------
+# Hash Calls
+# ---------------------
+@pytest.mark.parametrize("table", list(TABLES))
+def test_resizes_never_call_the_hash_function(table):
+    hash_function = CountingHash()
+    ht = TABLES[table](hash_function)
+    for i in range(2000):
+        ht.insert(f"key{i}", i)
+    ht.resize(ht.table_size * 4)
+    ht.resize(ht.table_size // 2)
+    # One call per insert; growth along the way and the explicit resizes add none
+    assert hash_function.calls == 2000
+    assert ht.resizes > 2
+
+
+@pytest.mark.parametrize("table", ["chaining", "linear_probing", "robin_hood"])
+def test_incremental_migration_never_calls_the_hash_function(table):
+    hash_function = CountingHash()
+    ht = TABLES[table](hash_function)
+    ht.rehash_step = 1
+    for i in range(500):
+        ht.insert(f"key{i}", i)
+    assert ht.old_table is not None
+    calls = hash_function.calls
+    # Every lookup hashes its key once, however many entries the same step moves
+    assert ht.search_many([f"key{i}" for i in range(500)]) == list(range(500))
+    assert hash_function.calls == calls + 500
+
+
+@pytest.mark.parametrize("table", ["chaining", "linear_probing", "robin_hood", "cuckoo"])
+def test_lookups_compare_hashes_before_keys(table):
+    # Every key shares a home slot but has its own full hash, so only the match is compared
+    ht = TABLES[table](lambda key: key.h)
+    ht.max_load_factor = None
+    keys = [CountingKey(f"key{i}", 3 + i * ht.table_size) for i in range(4)]
+    for i, key in enumerate(keys):
+        ht.insert(key, i)
+    CountingKey.comparisons = 0
+    for i, key in enumerate(keys):
+        assert ht.search(CountingKey(key.name, key.h)) == i
+    assert CountingKey.comparisons == len(keys)
@@ -0,0 +1,53 @@
+import tracemalloc
+
+from HashTable_Rahul_Khanna import HashTableCompact, HashTableLinearProbing, memory_report
+from model import key_pool, run_checked_model, snapshot
+
+
+def check_compact(ht):
+    # Every entry is reachable: no empty slot between its home slot and where it sits
+    size = ht.table_size
+    for index, key in enumerate(ht.keys):
+        if key is None:
+            assert ht.values[index] is None
+            continue
+        slot = ht.hashes[index] % size
+        while slot != index:
+            assert ht.keys[slot] is not None
+            slot = (slot + 1) % size
+
+
+def test_compact_matches_dict():
+    run_checked_model(HashTableCompact(), key_pool(16), seed=16, check=check_compact,
+                      reload=snapshot)
+
+
+def test_backward_shift_leaves_no_gaps():
+    ht = HashTableCompact(table_size=8, hash_function=lambda key: 6,
+                          max_load_factor=None, min_load_factor=None)
+    for i, key in enumerate("abcd"):
+        ht.insert(key, i)
+    ht.delete("b")
+    check_compact(ht)
+    assert ht.keys[6:] + ht.keys[:3] == ["a", "c", "d", None, None]
+    assert ht.search_many(list("abcd")) == [0, None, 2, 3]
+
+
+def table_bytes(strategy_class, items):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ht = strategy_class()
+    ht.insert_many(items)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used
+
+
+def test_parallel_arrays_use_less_memory_than_tuples():
+    items = [(f"key{i}", i) for i in range(20000)]
+    assert table_bytes(HashTableCompact, items) < table_bytes(HashTableLinearProbing, items)
+
+
+def test_memory_report(capsys):
+    memory_report(num_keys=1000)
+    assert "HashTableCompact" in capsys.readouterr().out
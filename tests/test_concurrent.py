@@ -0,0 +1,62 @@
+import sys
+import threading
+
+import pytest
+
+from HashTable_Rahul_Khanna import HashTableConcurrentChaining
+
+
+@pytest.fixture
+def frequent_switches():
+    # Hand the GIL over far more often than usual so threads interleave mid-operation
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_writers_and_readers(frequent_switches):
+    # Each writer owns its keys; the table starts small so writers keep resizing it
+    ht = HashTableConcurrentChaining(table_size=4, num_stripes=4)
+    errors = []
+
+    def writer(n):
+        for i in range(2000):
+            ht.insert(f"w{n}-{i}", i)
+            if i % 3 == 0:
+                ht.delete(f"w{n}-{i}")
+
+    def reader(n):
+        # A key is absent or holds the one value ever written for it
+        for i in range(4000):
+            value = ht.search(f"w{n % 4}-{i % 2000}")
+            if value not in (None, i % 2000):
+                errors.append(value)
+
+    run_threads(lambda n: writer(n) if n < 4 else reader(n), 8)
+    assert errors == []
+    expected = {f"w{n}-{i}": i for n in range(4) for i in range(2000) if i % 3}
+    assert dict(ht.items()) == expected
+    assert ht.count == len(expected)
+    assert ht.table_size % ht.num_stripes == 0
+
+
+def test_concurrent_updates_of_shared_keys(frequent_switches):
+    ht = HashTableConcurrentChaining(num_stripes=2)
+    run_threads(lambda n: [ht.insert(f"key{i}", n) for i in range(500)], 4)
+    assert ht.count == 500
+    assert {value for _, value in ht.items()} <= {0, 1, 2, 3}
+
+
+def test_stripe_count_is_validated():
+    with pytest.raises(ValueError, match="num_stripes"):
+        HashTableConcurrentChaining(num_stripes=0)
+    assert HashTableConcurrentChaining(table_size=10, num_stripes=4).table_size == 12
@@ -0,0 +1,87 @@
+import itertools
+import random
+
+import pytest
+
+from HashTable_Rahul_Khanna import HashTableCuckoo
+from model import ANAGRAMS, key_pool, run_checked_model, snapshot
+
+
+def test_small_cuckoo_matches_dict():
+    # A tiny table rehashes into fresh seeds and a larger size over and over
+    run_checked_model(HashTableCuckoo(table_size=2, rng_seed=3), key_pool(14), seed=14,
+                      reload=snapshot)
+
+
+def test_every_key_sits_in_a_candidate_slot_or_the_stash():
+    ht = HashTableCuckoo(rng_seed=4)
+    ht.insert_many([(f"key{i}", i) for i in range(2000)])
+    for index, entry in enumerate(ht.table):
+        if entry is not None:
+            assert index in ht._positions(entry[0])
+    assert len(ht.stash) <= ht.stash_size
+    assert ht.count / ht.table_size <= ht.max_load_factor
+
+
+@pytest.mark.parametrize("mixed", [False, True])
+def test_cuckoo_heavy_collisions_match_dict(mixed):
+    # Under the legacy hash every anagram shares both candidate slots, so at most
+    # num_hashes + stash_size of them fit at once and inserts are refused all the time.
+    # A refused insert must leave the table exactly as it was. Anagrams alone keep the
+    # table small; the mixed pool makes it grow, which changes the eviction walks.
+    pool = ["".join(p) for p in itertools.permutations("abcde")][:40]
+    if mixed:
+        pool += key_pool(8, size=40)
+    rng = random.Random(9)
+    ht = HashTableCuckoo(table_size=4, hash_function="legacy", rng_seed=2)
+    ref = {}
+    refused = 0
+    for step in range(3000):
+        key = rng.choice(pool)
+        roll = rng.random()
+        if roll < 0.5:
+            value = rng.randrange(1000)
+            ht.insert(key, value)
+            if ht.search(key) == value:
+                ref[key] = value
+            else:
+                refused += 1
+        elif roll < 0.75:
+            ht.delete(key)
+            ref.pop(key, None)
+        elif roll < 0.9:
+            assert ht.search(key) == ref.get(key), step
+        else:
+            keys = [rng.choice(pool) for _ in range(10)]
+            expected = [ref.pop(k, None) is not None for k in keys]
+            assert ht.delete_many(keys) == expected, step
+        assert ht.count == len(ref), step
+    assert dict(ht.items()) == ref
+    assert refused > 0
+
+
+# ---------------------
+# Full Tables
+# ---------------------
+def test_cuckoo_full_insert_keeps_existing_keys(capsys):
+    ht = HashTableCuckoo(hash_function="legacy", rng_seed=1)
+    stored = {}
+    for i, key in enumerate(ANAGRAMS[:8]):
+        ht.insert(key, i)
+        if ht.search(key) == i:
+            stored[key] = i
+        # A rejected key must leave every earlier key where it was
+        assert dict(ht.items()) == stored
+        assert ht.count == len(stored)
+    assert len(stored) == ht.num_hashes + ht.stash_size
+    assert "HashTable is full" in capsys.readouterr().out
+
+
+def test_cuckoo_from_items_overflow_is_consistent(capsys):
+    items = [(key, i) for i, key in enumerate(ANAGRAMS[:8])]
+    ht = HashTableCuckoo.from_items(items, hash_function="legacy", rng_seed=1)
+    stored = dict(ht.items())
+    assert len(stored) == ht.count == ht.num_hashes + ht.stash_size
+    assert all(dict(items)[key] == value for key, value in stored.items())
+    assert all(ht.search(key) == value for key, value in stored.items())
+    assert "HashTable is full" in capsys.readouterr().out
@@ -0,0 +1,119 @@
+import itertools
+
+import pytest
+
+from hash_perfect import HashTablePerfect
+from HashTable_Rahul_Khanna import (
+    HashTableChaining,
+    HashTableCompact,
+    HashTableCuckoo,
+    HashTableDirect,
+    HashTableLinearProbing,
+    HashTableRobinHood,
+    HashTableSwiss,
+    TreeBucket,
+    get_hash_function,
+    np,
+    siphash_hash,
+)
+from model import key_pool, run_checked_model, snapshot
+
+# Permutations of one word share every legacy hash
+FLOOD = ["".join(p) for p in itertools.islice(itertools.permutations("abcdefgh"), 500)]
+
+SEEDED = [HashTableChaining, HashTableLinearProbing, HashTableRobinHood, HashTableCompact,
+          HashTableCuckoo]
+if np is not None:
+    SEEDED.append(HashTableSwiss)
+
+
+def check_chaining(ht):
+    if ht.treeify_threshold is None:
+        return
+    for table in (ht.table, ht.old_table or []):
+        for bucket in table:
+            if bucket is not None and type(bucket) is not TreeBucket:
+                assert len(list(bucket.entries())) <= ht.treeify_threshold
+
+
+# ---------------------
+# Tree Buckets
+# ---------------------
+def test_tree_buckets_match_dict():
+    # Tiny tables mid-migration, with the legacy hash piling keys into shared buckets
+    ht = HashTableChaining(table_size=4, rehash_step=1, treeify_threshold=2, hash_function="legacy")
+    run_checked_model(ht, key_pool(1), seed=13, check=check_chaining, reload=snapshot)
+
+
+@pytest.mark.parametrize("bucket_type", ["linked_list", "array"])
+def test_flooded_bucket_becomes_a_tree_and_back(bucket_type):
+    ht = HashTableChaining(hash_function="legacy", bucket_type=bucket_type)
+    ht.insert_many([(key, i) for i, key in enumerate(FLOOD)])
+    trees = [bucket for bucket in ht.table if type(bucket) is TreeBucket]
+    assert len(trees) == 1 and len(trees[0].keys) == len(FLOOD)
+    assert ht.search_many(FLOOD[::-1]) == list(range(len(FLOOD)))[::-1]
+    check_chaining(ht)
+    # Shrinking to three quarters of the threshold turns the tree back into a chain
+    ht.min_load_factor = None
+    ht.delete_many(FLOOD[ht.untreeify_threshold:])
+    assert not any(type(bucket) is TreeBucket for bucket in ht.table)
+    assert ht.untreeifications == 1
+    assert ht.search_many(FLOOD[:ht.untreeify_threshold]) == list(range(ht.untreeify_threshold))
+
+
+def test_tree_keeps_keys_with_equal_bytes_apart():
+    ht = HashTableChaining(hash_function=lambda key: 0, treeify_threshold=2)
+    for i, key in enumerate(["1", b"1", "2", b"2"]):
+        ht.insert(key, i)
+    assert any(type(bucket) is TreeBucket for bucket in ht.table)
+    assert ht.search_many(["1", b"1", "2", b"2", "3"]) == [0, 1, 2, 3, None]
+
+
+# ---------------------
+# Seeded Hashing
+# ---------------------
+def test_seed_without_hash_function_selects_siphash():
+    hash_function = get_hash_function(seed=1234)
+    assert hash_function("apple") == siphash_hash("apple", seed=1234)
+    first, second = get_hash_function(seed="random"), get_hash_function(seed="random")
+    assert first("apple") != second("apple")
+
+
+@pytest.mark.parametrize("hash_function", ["fnv1a", "legacy", "python", lambda key: 7])
+def test_seed_for_unseeded_hash_is_rejected(hash_function):
+    with pytest.raises(ValueError):
+        get_hash_function(hash_function, seed="random")
+
+
+@pytest.mark.parametrize("strategy_class", SEEDED)
+def test_random_seed_per_table(strategy_class):
+    first, second = strategy_class(seed="random"), strategy_class(seed="random")
+    assert first.hash_function("apple") != second.hash_function("apple")
+    first.insert_many([(f"key{i}", i) for i in range(1000)])
+    assert first.search_many(["key0", "key999", "missing"]) == [0, 999, None]
+
+
+@pytest.mark.parametrize("strategy_class", [*SEEDED, HashTableDirect, HashTablePerfect])
+def test_seed_keys_the_table_hash(strategy_class):
+    ht = strategy_class(seed=1234)
+    assert ht.hash_function("apple") == siphash_hash("apple", seed=1234)
+    with pytest.raises(ValueError):
+        strategy_class(hash_function="legacy", seed=1234)
+
+
+def test_cuckoo_rng_seed_repeats_the_layout():
+    # Same hash seed and RNG seed: the same remix seeds, evictions and rebuilds
+    first, second = (HashTableCuckoo(table_size=4, seed=99, rng_seed=5) for _ in range(2))
+    for ht in (first, second):
+        ht.insert_many([(key, i) for i, key in enumerate(key_pool(25))])
+    assert first.seeds == second.seeds and first.table == second.table
+    assert HashTableCuckoo(rng_seed=6).seeds != HashTableCuckoo(rng_seed=5).seeds
+
+
+def test_seeded_perfect_table_spreads_a_flood():
+    # Under the legacy hash every anagram shares a full hash; a seeded siphash tells them apart
+    items = [(key, i) for i, key in enumerate(FLOOD)]
+    with pytest.raises(ValueError, match="share a full hash"):
+        HashTablePerfect.from_items(items, hash_function="legacy")
+    ht = HashTablePerfect.from_items(items, seed="random")
+    assert ht.search_many(FLOOD) == list(range(len(FLOOD)))
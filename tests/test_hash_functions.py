@@ -0,0 +1,86 @@
+import pytest
+
+from HashTable_Rahul_Khanna import (
+    HASH_FUNCTIONS,
+    HashTableChaining,
+    avalanche_score,
+    fnv1a_hash,
+    get_hash_function,
+    legacy_hash,
+    siphash_hash,
+)
+from HashTable_Rahul_Khanna import test_hash_distribution as hash_distribution
+
+# SipHash reference key: bytes 00 01 02 ... 0f, read little-endian
+SIPHASH_KEY = int.from_bytes(bytes(range(16)), "little")
+
+
+# ---------------------
+# Reference Vectors
+# ---------------------
+def test_fnv1a_reference_vectors():
+    assert fnv1a_hash("") == 0xcbf29ce484222325
+    assert fnv1a_hash("a") == 0xaf63dc4c8601ec8c
+    assert fnv1a_hash("foobar") == 0x85944171f73967e8
+
+
+def test_siphash_reference_vectors():
+    assert siphash_hash(b"", SIPHASH_KEY) == 0x726fdb47dd0e0e31
+    assert siphash_hash(bytes(range(15)), SIPHASH_KEY) == 0xa129ca6149be45e5
+
+
+# ---------------------
+# Registry
+# ---------------------
+@pytest.mark.parametrize("name", sorted(HASH_FUNCTIONS))
+def test_hashes_are_full_width_and_deterministic(name):
+    hash_function = get_hash_function(name)
+    for key in ("", "apple", "ключ", "x" * 100, b"apple"):
+        h = hash_function(key)
+        assert 0 <= h < 1 << 64
+        assert hash_function(key) == h
+
+
+@pytest.mark.parametrize("name", ["fnv1a", "murmur", "siphash"])
+def test_byte_hashes_read_str_as_utf8(name):
+    hash_function = get_hash_function(name)
+    for key in ("apple", "ключ"):
+        assert hash_function(key) == hash_function(key.encode("utf-8"))
+
+
+def test_unknown_hash_function_is_rejected():
+    with pytest.raises(ValueError, match="Unknown hash function"):
+        get_hash_function("crc32")
+    with pytest.raises(ValueError):
+        HashTableChaining(hash_function="crc32")
+
+
+def test_callable_hash_function_is_used_as_given():
+    ht = HashTableChaining(hash_function=len)
+    ht.insert_many([("apple", 1), ("pear", 2)])
+    assert ht.hash_function is len
+    assert ht.search_many(["apple", "pear", "plum"]) == [1, 2, None]
+
+
+# ---------------------
+# Distribution Quality
+# ---------------------
+def test_anagrams_collide_only_under_the_legacy_hash():
+    words = ["apple", "papel", "elppa", "pplea"]
+    assert len({legacy_hash(word) for word in words}) == 1
+    for name in ("fnv1a", "murmur", "siphash"):
+        assert len({HASH_FUNCTIONS[name](word) for word in words}) == len(words)
+
+
+@pytest.mark.parametrize("name", ["murmur", "siphash"])
+def test_mixing_hashes_avalanche(name):
+    mean, worst_bias = avalanche_score(HASH_FUNCTIONS[name], num_keys=50)
+    assert abs(mean - 0.5) < 0.01
+    assert worst_bias < 0.05
+
+
+def test_distribution_report(capsys):
+    results = hash_distribution(["legacy", "siphash"], table_size=101, num_keys=5000)
+    # Sequential keys pile up under sum-of-ordinals and spread out under siphash
+    assert results["legacy"]["chi_square"] > 10 * results["siphash"]["chi_square"]
+    assert "Chi-square" in capsys.readouterr().out
@@ -0,0 +1,11 @@
+import pytest
+
+from model import EXACT_STRATEGIES, key_pool, run_checked_model, snapshot
+
+
+# Every registry strategy under its defaults, reloaded from a snapshot every 500 steps;
+# the per-strategy files add their own invariants and configurations
+@pytest.mark.parametrize("strategy", list(EXACT_STRATEGIES))
+def test_strategy_matches_dict(strategy):
+    run_checked_model(EXACT_STRATEGIES[strategy](None), key_pool(1), seed=len(strategy),
+                      reload=snapshot)
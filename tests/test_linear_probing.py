@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from HashTable_Rahul_Khanna import _TOMBSTONE, DELETE_MODES, HashTableLinearProbing
+from model import key_pool, run_checked_model, snapshot
+
+
+def check_linear_probing(ht):
+    if ht.delete_mode == "backward_shift":
+        assert _TOMBSTONE not in ht.table
+    else:
+        assert sum(entry is _TOMBSTONE for entry in ht.table) == ht.tombstones
+
+
+@pytest.mark.parametrize("delete_mode", DELETE_MODES)
+@pytest.mark.parametrize("table_size,rehash_step", [(11, 4), (2, 1)])
+def test_linear_probing_matches_dict(delete_mode, table_size, rehash_step):
+    ht = HashTableLinearProbing(table_size=table_size, rehash_step=rehash_step,
+                                delete_mode=delete_mode)
+    run_checked_model(ht, key_pool(12), seed=table_size, check=check_linear_probing,
+                      reload=snapshot)
+
+
+# ---------------------
+# Deletes
+# ---------------------
+@pytest.mark.parametrize("delete_mode", DELETE_MODES)
+def test_delete_keeps_rest_of_cluster_reachable(delete_mode):
+    # Anagrams share a legacy home slot, so they form one cluster; emptying a slot in
+    # the middle used to cut off every key after it
+    ht = HashTableLinearProbing(table_size=16, hash_function="legacy", delete_mode=delete_mode,
+                                max_load_factor=None, min_load_factor=None)
+    words = ["apple", "papel", "elppa", "pplea"]
+    for i, word in enumerate(words):
+        ht.insert(word, i)
+    ht.delete("papel")
+    assert ht.search_many(words) == [0, None, 2, 3]
+    assert ht.tombstones == (1 if delete_mode == "tombstone" else 0)
+    ht.insert("papel", 4)
+    assert ht.search_many(words) == [0, 4, 2, 3]
+    assert ht.count == 4
+
+
+def test_backward_shift_wraps_around_the_table_end():
+    # A cluster starting in the last slot continues at slot 0
+    ht = HashTableLinearProbing(table_size=8, hash_function=lambda key: 7,
+                                delete_mode="backward_shift",
+                                max_load_factor=None, min_load_factor=None)
+    for i, key in enumerate("abcd"):
+        ht.insert(key, i)
+    ht.delete("a")
+    assert ht.table[7][0] == "b" and ht.table[0][0] == "c" and ht.table[1][0] == "d"
+    assert ht.table[2] is None
+    assert ht.search_many(list("abcd")) == [None, 1, 2, 3]
+
+
+def test_unknown_delete_mode_is_rejected():
+    with pytest.raises(ValueError, match="delete_mode"):
+        HashTableLinearProbing(delete_mode="lazy")
+
+
+def test_tombstones_are_compacted():
+    ht = HashTableLinearProbing(table_size=64, rehash_step=1, max_tombstone_ratio=0.2)
+    rng = random.Random(10)
+    live = {f"key{i}": i for i in range(30)}
+    ht.insert_many(live.items())
+    for i in range(5000):
+        key = rng.choice(list(live))
+        ht.delete(key)
+        del live[key]
+        live[f"churn{i}"] = i
+        ht.insert(f"churn{i}", i)
+        assert ht.tombstones <= ht.max_tombstone_ratio * ht.table_size + 1
+    assert dict(ht.items()) == live
+
+
+def test_full_insert_during_migration_keeps_old_copy(capsys):
+    # A fixed-size table draining into a smaller one: once the new table is full, an
+    # update of a key still waiting in the old table must leave that key where it was
+    hashes = {"c": 7, "x1": 0, "x2": 0, "x3": 0, "x4": 0}
+    ht = HashTableLinearProbing(table_size=8, hash_function=hashes.get, rehash_step=1,
+                                max_load_factor=None, min_load_factor=None,
+                                max_tombstone_ratio=None)
+    ht.insert("c", "old")
+    ht._start_rehash(4)
+    for key in ("x1", "x2", "x3", "x4"):
+        ht.insert(key, key)
+    ht.insert("c", "new")
+    assert "HashTable is full" in capsys.readouterr().out
+    assert ht.count == 5
+    assert ht.search("c") == "old"
@@ -0,0 +1,115 @@
+import io
+import json
+
+import pytest
+
+import hash_loader
+from hash_loader import HyperLogLog, chunks, detect_format, estimate_from_size, load, read_records
+from HashTable_Rahul_Khanna import HashTable, HashTableLinearProbing
+
+
+def write_csv(path, num_rows, header=True):
+    lines = ["id,name"] if header else []
+    # Fixed-width fields, so a sample of the first lines has the mean line length
+    lines += [f"user{i:06d},name{i:06d}" for i in range(num_rows)]
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+# ---------------------
+# Record Readers
+# ---------------------
+def test_format_follows_the_extension():
+    assert detect_format("rows.CSV") == "csv"
+    assert detect_format("rows.tab") == "tsv"
+    assert detect_format("events.ndjson") == "jsonl"
+    with pytest.raises(ValueError, match="Cannot tell the format"):
+        detect_format("rows.parquet")
+
+
+def test_csv_and_tsv_records():
+    data = b"id,name,city\nu1,Ann,Oslo\nu2,\"Bo, Jr\",Rome\n"
+    assert list(read_records(io.BytesIO(data), "csv", "id", "name")) == [("u1", "Ann"), ("u2", "Bo, Jr")]
+    records = list(read_records(io.BytesIO(data.replace(b",", b"\t")), "tsv", "city"))
+    assert records[0] == ("Oslo", {"id": "u1", "name": "Ann", "city": "Oslo"})
+    # Without a header, fields are column indexes
+    assert list(read_records(io.BytesIO(b"u1,Ann\nu2,Bo\n"), "csv", "1", "0", header=False)) == \
+        [("Ann", "u1"), ("Bo", "u2")]
+
+
+def test_jsonl_records_skip_blank_lines_and_stringify_keys():
+    data = b'{"id": 1, "tags": ["a"]}\n\n{"id": 2, "tags": []}\n'
+    assert list(read_records(io.BytesIO(data), "jsonl", "id", "tags")) == [("1", ["a"]), ("2", [])]
+    assert list(read_records(io.BytesIO(data), "jsonl", "id"))[1] == ("2", {"id": 2, "tags": []})
+
+
+def test_chunks_cover_the_input_in_order():
+    assert list(chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunks([], 3)) == []
+
+
+# ---------------------
+# Cardinality Estimates
+# ---------------------
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_hyperloglog_estimate(vectorized, monkeypatch):
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(hash_loader, "np", None)
+    hll = HyperLogLog(precision=12)
+    for chunk in chunks((f"key{i % 50000}" for i in range(100000)), 10000):
+        hll.add_many(chunk)
+    # Duplicates do not count; standard error at precision 12 is about 1.6%
+    assert abs(hll.estimate() - 50000) < 0.05 * 50000
+
+
+def test_hyperloglog_small_range_and_bad_precision():
+    hll = HyperLogLog()
+    hll.add_many(["apple", "pear", "apple"])
+    assert hll.estimate() == 2
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=20)
+
+
+def test_size_estimate(tmp_path):
+    assert estimate_from_size(write_csv(tmp_path / "small.csv", 10)) == 11  # whole file sampled
+    estimate = estimate_from_size(write_csv(tmp_path / "rows.csv", 20000))
+    assert abs(estimate - 20001) < 0.05 * 20001
+
+
+# ---------------------
+# Loader
+# ---------------------
+@pytest.mark.parametrize("estimate", ["size", "hll"])
+def test_presized_load_grows_only_once(tmp_path, estimate):
+    path = write_csv(tmp_path / "rows.csv", 20000)
+    table, report = load(path, key_field="id", value_field="name", estimate=estimate,
+                         chunk_size=1000, progress=None)
+    assert report["rows"] == report["entries"] == 20000
+    assert report["resizes"] == 1  # the reserve() itself
+    assert table.search_many(["user000000", "user019999", "user020000"]) == ["name000000", "name019999", None]
+
+
+def test_load_without_estimate_grows_and_reports_progress(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text("".join(json.dumps({"key": f"k{i % 300}", "n": i}) + "\n" for i in range(1000)))
+    calls = []
+    table, report = load(str(path), HashTable(HashTableLinearProbing(table_size=8)), value_field="n",
+                         estimate="none", chunk_size=100,
+                         progress=lambda *args, **kwargs: calls.append((args, kwargs)),
+                         report_every=0)
+    assert report["estimate"] is None and report["resizes"] > 0
+    assert report["rows"] == 1000 and report["entries"] == 300
+    assert table.search("k0") == 900  # later rows overwrite earlier ones
+    assert calls[-1] == ((1000, 1.0, report["load_seconds"]), {"done": True})
+    assert [args[0] for args, _ in calls[:-1]] == list(range(100, 1001, 100))
+
+
+def test_cli_prints_report_and_writes_snapshot(tmp_path, capsys):
+    path = write_csv(tmp_path / "rows.csv", 50)
+    snapshot = str(tmp_path / "rows.snap")
+    assert hash_loader.main([path, "--key", "id", "--value", "name", "--snapshot", snapshot]) == 0
+    out = capsys.readouterr().out
+    assert json.loads(out[:out.rindex("}") + 1])["rows"] == 50
+    assert HashTable.load(snapshot).search("user000007") == "name000007"
@@ -0,0 +1,84 @@
+import pytest
+
+from hash_mapped import HashTableMapped
+from model import key_pool, run_model
+
+
+def test_mapped_matches_dict(tmp_path):
+    with HashTableMapped.create(str(tmp_path / "table"), table_size=4) as ht:
+        ht, ref = run_model(ht, key_pool(4), seed=5, steps=1500)
+        assert dict(ht.items()) == ref
+
+
+def test_keys_and_values_keep_their_types(tmp_path):
+    values = [None, True, False, 0, -1, 255, -(2 ** 100), 2 ** 64, 1.5, float("-inf"),
+              "", "text", "ключ", b"", b"\x00\xff"]
+    items = [("1", "str"), (b"1", "bytes"), ("", "empty"), ("ключ", "utf-8")]
+    items += [(f"value{i}", value) for i, value in enumerate(values)]
+    with HashTableMapped.create(str(tmp_path / "table"), items) as ht:
+        ht.resize()
+        assert dict(ht.items()) == dict(items)
+        for key, value in items:
+            found = ht.search(key)
+            assert found == value and type(found) is type(value)
+
+
+@pytest.mark.parametrize("key", [1, 1.0, None, ("a",)])
+def test_other_key_types_are_rejected(tmp_path, key):
+    with HashTableMapped.create(str(tmp_path / "table"), [("1", 1)]) as ht:
+        for operation in (lambda: ht.insert(key, 2), lambda: ht.search(key),
+                          lambda: ht.delete(key)):
+            with pytest.raises(TypeError, match="keys must be str or bytes"):
+                operation()
+        assert dict(ht.items()) == {"1": 1}
+
+
+@pytest.mark.parametrize("value", [[1], {"a": 1}, object(), 1j])
+def test_other_value_types_are_rejected(tmp_path, value):
+    with HashTableMapped.create(str(tmp_path / "table")) as ht:
+        with pytest.raises(TypeError, match="values must be"):
+            ht.insert("apple", value)
+        assert ht.count == 0
+
+
+def test_reopened_file_keeps_every_entry(tmp_path):
+    path = str(tmp_path / "table")
+    with HashTableMapped.create(path, [(f"key{i}", i) for i in range(1000)]) as ht:
+        ht.insert("key0", "updated")
+        ht.delete("key1")
+    with HashTableMapped(path) as ht:
+        assert ht.count == 999
+        assert ht.search_many(["key0", "key1", "key999"]) == ["updated", None, 999]
+
+
+def test_read_only_file_refuses_writes(tmp_path):
+    path = str(tmp_path / "table")
+    HashTableMapped.create(path, [("apple", 1)]).close()
+    with HashTableMapped(path) as ht, pytest.raises(ValueError, match="read-only"):
+        ht.insert("pear", 2)
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "table"
+    path.write_bytes(bytes(256))
+    with pytest.raises(ValueError, match="not a mapped hash table"):
+        HashTableMapped(str(path))
+
+
+# ---------------------
+# Seeds
+# ---------------------
+def test_mapped_random_seed_is_written_and_reused(tmp_path):
+    path = str(tmp_path / "table")
+    items = [(f"key{i}", i) for i in range(200)]
+    with HashTableMapped.create(path, items, seed="random") as ht:
+        seed = ht.seed
+        assert ht.hash_name == "siphash" and isinstance(seed, int)
+    with HashTableMapped(path) as ht:
+        assert ht.seed == seed
+        assert ht.search_many(["key0", "key199", "missing"]) == [0, 199, None]
+
+
+def test_mapped_rejects_seed_for_unseeded_hash(tmp_path):
+    with pytest.raises(ValueError):
+        HashTableMapped.create(str(tmp_path / "table"), hash_function="fnv1a", seed=5)
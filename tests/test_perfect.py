@@ -0,0 +1,56 @@
+import pytest
+
+from hash_perfect import HashTablePerfect
+from model import key_pool, snapshot
+
+
+def test_perfect_matches_dict():
+    pool = key_pool(7, size=5000)
+    items = {key: i for i, key in enumerate(pool[:4000])}
+    ht = HashTablePerfect.from_items(items)
+    assert ht.search_many(pool) == [items.get(key) for key in pool]
+    assert [ht.search(key) for key in pool[3990:4010]] == [items.get(key) for key in pool[3990:4010]]
+    assert dict(ht.items()) == items
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+@pytest.mark.parametrize("bucket_size", [1, 2, 4])
+def test_every_key_gets_a_slot_of_its_own(vectorized, bucket_size, monkeypatch):
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        # Hashes as a list take the one-bucket-at-a-time build
+        monkeypatch.setattr(HashTablePerfect, "_bulk_hashes",
+                            lambda self, keys: [self.hash_function(key) for key in keys])
+    items = [(f"key{i}", i) for i in range(3000)]
+    ht = HashTablePerfect.from_items(items, bucket_size=bucket_size, load_factor=0.95)
+    assert sum(key is not None for key in ht.keys) == ht.count == 3000
+    assert ht.table_size == round(3000 / 0.95)
+    assert ht.search_many([key for key, _ in items]) == list(range(3000))
+    # The displacements are all the metadata there is
+    assert ht.bits_per_key() <= 16 / bucket_size + 1
+
+
+def test_perfect_is_read_only():
+    ht = HashTablePerfect.from_items([("apple", 1), ("pear", None)])
+    for change in (lambda: ht.insert("plum", 3), lambda: ht.delete("apple"),
+                   lambda: ht.delete_many(["apple"])):
+        with pytest.raises(TypeError, match="read-only"):
+            change()
+    assert ht.search_many(["apple", "pear", "plum"], "missing") == [1, None, "missing"]
+
+
+def test_empty_and_reloaded_tables():
+    empty = HashTablePerfect.from_items([])
+    assert empty.search("apple") is None and empty.count == 0
+    ht = snapshot(HashTablePerfect.from_items({"apple": 1, "pear": 2}))
+    assert ht.search_many(["apple", "pear", "plum"]) == [1, 2, None]
+
+
+def test_bad_configuration_is_rejected():
+    with pytest.raises(ValueError, match="load_factor"):
+        HashTablePerfect([("apple", 1)], load_factor=1.5)
+    with pytest.raises(ValueError, match="bucket_size"):
+        HashTablePerfect([("apple", 1)], bucket_size=0)
+    with pytest.raises(ValueError, match="share a full hash"):
+        HashTablePerfect([("apple", 1), ("pear", 2)], hash_function=lambda key: 7)
@@ -0,0 +1,100 @@
+import pytest
+
+from hash_filters import PREFILTERS, BloomFilter, CountingBloomFilter
+from hash_mapped import HashTableMapped
+from hash_sharded import HashTableSharded
+from HashTable_Rahul_Khanna import STRATEGIES, HashTable, HashTableLinearProbing, fnv1a_hash, np
+from model import key_pool, run_model
+
+MEMBERS = [fnv1a_hash(f"key{i}") for i in range(5000)]
+OUTSIDERS = [fnv1a_hash(f"miss{i}") for i in range(20000)]
+
+
+# ---------------------
+# Filters
+# ---------------------
+@pytest.mark.parametrize("prefilter", sorted(PREFILTERS))
+@pytest.mark.parametrize("fpr", [0.1, 0.01])
+def test_filter_rate_meets_its_target(prefilter, fpr):
+    bloom = PREFILTERS[prefilter](len(MEMBERS), fpr=fpr)
+    for h in MEMBERS:
+        bloom.add(h)
+    assert all(bloom.might_contain(h) for h in MEMBERS)  # never a false negative
+    false_positives = sum(bloom.might_contain(h) for h in OUTSIDERS)
+    assert false_positives < 1.5 * fpr * len(OUTSIDERS)
+
+
+@pytest.mark.parametrize("prefilter", sorted(PREFILTERS))
+def test_batch_checks_match_single_checks(prefilter):
+    bloom = PREFILTERS[prefilter](1000, fpr=0.2)
+    for h in MEMBERS[:1000]:
+        bloom.add(h)
+    hashes = MEMBERS[:500] + OUTSIDERS[:500]
+    expected = [bloom.might_contain(h) for h in hashes]
+    assert bloom.might_contain_many(hashes) == expected
+    if np is not None:
+        assert bloom.might_contain_many(np.array(hashes, dtype=np.uint64)) == expected
+
+
+def test_counting_filter_forgets_removed_keys():
+    bloom = CountingBloomFilter(1000)
+    for h in MEMBERS[:1000]:
+        bloom.add(h)
+    for h in MEMBERS[:999]:
+        bloom.remove(h)
+    assert bloom.might_contain(MEMBERS[999])
+    assert sum(bloom.might_contain(h) for h in MEMBERS[:999]) < 50
+    assert CountingBloomFilter.supports_delete and not BloomFilter.supports_delete
+
+
+def test_bad_rate_is_rejected():
+    with pytest.raises(ValueError, match="fpr"):
+        BloomFilter(100, fpr=1)
+
+
+# ---------------------
+# Facade
+# ---------------------
+@pytest.mark.parametrize("strategy", ["chaining", "linear_probing", "robin_hood", "cuckoo"])
+@pytest.mark.parametrize("prefilter", [None, "bloom", "blocked", "counting"])
+def test_facade_matches_dict(strategy, prefilter):
+    ht = HashTable(STRATEGIES[strategy](None), prefilter=prefilter, fpr=0.05)
+    ht, ref = run_model(ht, key_pool(2), seed=3)
+    assert dict(ht.items()) == ref
+
+
+def test_misses_skip_the_table():
+    ht = HashTable(HashTableLinearProbing(), prefilter="bloom", fpr=0.01)
+    ht.insert_many([(f"key{i}", i) for i in range(1000)])
+    assert ht.search_many([f"miss{i}" for i in range(1000)]) == [None] * 1000
+    report = ht.stats()["prefilter"]
+    assert report["filtered"] > 950
+    assert report["type"] == "bloom"
+
+
+def test_unknown_prefilter_is_rejected():
+    with pytest.raises(ValueError, match="prefilter must be one of"):
+        HashTable(HashTableLinearProbing(), prefilter="cuckoo")
+
+
+def test_counting_prefilter_counts_none_valued_key_once():
+    ht = HashTable(HashTableLinearProbing(), prefilter="counting")
+    ht.insert("apple", None)
+    ht.insert_many([("apple", 1)])  # an update: the filter must not count apple twice
+    ht.delete("apple")
+    assert ht.search("apple") is None
+    assert ht.stats()["prefilter"]["filtered"] == 1
+
+
+def test_prefilter_on_mapped_table(tmp_path):
+    with HashTableMapped.create(str(tmp_path / "table"), [("apple", 1), ("pear", None)]) as mapped:
+        ht = HashTable(mapped, prefilter="bloom")
+        assert ht.search_many(["apple", "pear", "plum"]) == [1, None, None]
+        ht.insert("plum", 3)
+        assert ht.search("plum") == 3
+        assert ht.stats()["prefilter"]["false_positives"] == 0
+
+
+def test_prefilter_rejects_strategy_without_hashes():
+    with HashTableSharded(num_shards=1) as sharded, pytest.raises(ValueError):
+        HashTable(sharded, prefilter="bloom")
@@ -0,0 +1,76 @@
+import pytest
+
+from HashTable_Rahul_Khanna import HashTableChaining, HashTableLinearProbing, HashTableRobinHood
+from model import key_pool, run_checked_model, snapshot
+
+RESIZING = [HashTableChaining, HashTableLinearProbing, HashTableRobinHood]
+
+
+# ---------------------
+# Automatic Growth and Shrinking
+# ---------------------
+@pytest.mark.parametrize("strategy_class", RESIZING)
+def test_load_factor_drives_growth_and_shrinking(strategy_class):
+    ht = strategy_class(table_size=8)
+    for i in range(1000):
+        ht.insert(f"key{i}", i)
+        assert ht.count <= ht.max_load_factor * ht.table_size
+    assert ht.table_size >= 1000 / ht.max_load_factor
+    assert ht.resizes > 0
+    for i in range(1000):
+        ht.delete(f"key{i}")
+    ht.search("key0")  # one more step drains any migration still in progress
+    assert ht.table_size == ht.min_table_size == 8
+    assert ht.count == 0
+
+
+@pytest.mark.parametrize("strategy_class", RESIZING)
+def test_none_disables_resizing(strategy_class):
+    ht = strategy_class(table_size=64, max_load_factor=None, min_load_factor=None)
+    ht.insert_many([(f"key{i}", i) for i in range(40)])
+    ht.delete_many([f"key{i}" for i in range(40)])
+    assert ht.table_size == 64  # tombstone compaction may still rebuild at the same size
+
+
+# ---------------------
+# Incremental Rehashing
+# ---------------------
+@pytest.mark.parametrize("strategy_class", RESIZING)
+def test_rehash_moves_a_bounded_step_per_operation(strategy_class):
+    ht = strategy_class(table_size=64, rehash_step=2)
+    i = 0
+    while ht.old_table is None:
+        ht.insert(f"key{i}", i)
+        i += 1
+    # Every key stays reachable while the old table drains two slots per operation
+    operations = 0
+    while ht.old_table is not None:
+        assert ht.search(f"key{operations % i}") == operations % i
+        operations += 1
+    assert operations >= 64 // 2 - 1
+    assert ht.search_many([f"key{j}" for j in range(i)]) == list(range(i))
+
+
+@pytest.mark.parametrize("strategy_class", RESIZING)
+def test_resize_completes_the_migration(strategy_class):
+    ht = strategy_class(table_size=4, rehash_step=1)
+    ht.insert_many([(f"key{i}", i) for i in range(20)])
+    ht.resize(256)
+    assert ht.old_table is None and ht.table_size == 256
+    assert dict(ht.items()) == {f"key{i}": i for i in range(20)}
+
+
+# Tiny tables with rehash_step=1 stay in the middle of a migration most of the time
+MIGRATING = {
+    "chaining": lambda: HashTableChaining(table_size=2, rehash_step=1),
+    "chaining_array": lambda: HashTableChaining(table_size=2, rehash_step=1, bucket_type="array"),
+    "linear_probing": lambda: HashTableLinearProbing(table_size=2, rehash_step=1),
+    "robin_hood": lambda: HashTableRobinHood(table_size=2, rehash_step=1),
+}
+
+
+@pytest.mark.parametrize("strategy", list(MIGRATING))
+def test_migrating_table_matches_dict(strategy):
+    _, _, migrated = run_checked_model(MIGRATING[strategy](), key_pool(11), seed=len(strategy),
+                                       reload=snapshot)
+    assert migrated
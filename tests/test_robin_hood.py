@@ -0,0 +1,47 @@
+import pytest
+
+from HashTable_Rahul_Khanna import HashTableRobinHood
+from model import key_pool, run_checked_model, snapshot
+
+
+def check_robin_hood(ht):
+    # Distances are exact, and no entry sits further from home than the one after it + 1
+    size = ht.table_size
+    for index, entry in enumerate(ht.table):
+        if entry is None:
+            assert ht.distances[index] == -1
+            continue
+        assert ht.distances[index] == (index - entry[2] % size) % size
+        following = ht.distances[(index + 1) % size]
+        assert following <= ht.distances[index] + 1
+
+
+@pytest.mark.parametrize("table_size,rehash_step", [(11, 4), (2, 1)])
+def test_robin_hood_matches_dict(table_size, rehash_step):
+    ht = HashTableRobinHood(table_size=table_size, rehash_step=rehash_step)
+    run_checked_model(ht, key_pool(13), seed=table_size, check=check_robin_hood,
+                      reload=snapshot)
+
+
+def test_poorer_entry_takes_the_slot():
+    # b shares a's home slot; it is further from home than c, so c moves on for it
+    hashes = {"a": 0, "c": 1, "b": 0}
+    ht = HashTableRobinHood(table_size=8, hash_function=hashes.get,
+                            max_load_factor=None, min_load_factor=None)
+    for key in hashes:
+        ht.insert(key, key)
+    assert [entry and entry[0] for entry in ht.table[:4]] == ["a", "b", "c", None]
+    assert ht.distances[:4] == [0, 1, 1, -1]
+    assert ht.search_many(["a", "b", "c"]) == ["a", "b", "c"]
+
+
+def test_delete_shifts_the_cluster_back():
+    hashes = {"a": 0, "b": 0, "c": 0, "d": 3}
+    ht = HashTableRobinHood(table_size=8, hash_function=hashes.get,
+                            max_load_factor=None, min_load_factor=None)
+    for key in hashes:
+        ht.insert(key, key)
+    ht.delete("a")
+    check_robin_hood(ht)
+    assert ht.distances[:5] == [0, 1, -1, 0, -1]
+    assert ht.search_many(["a", "b", "c", "d"]) == [None, "b", "c", "d"]
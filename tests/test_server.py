@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from hash_perfect import HashTablePerfect
+from hash_server import (
+    HashTableClient,
+    HashTableServer,
+    ProtocolError,
+    ResponseError,
+    encode_request,
+    read_request,
+    run_load,
+)
+
+
+def serve(test, table=None):
+    # Runs test(client, port) against a fresh server on a free port
+    async def main():
+        server = await HashTableServer(table).start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        client = await HashTableClient.connect(port=port)
+        try:
+            return await test(client, port)
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+    return asyncio.run(main())
+
+
+def parse(data):
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_request(reader)
+    return asyncio.run(main())
+
+
+# ---------------------
+# Protocol
+# ---------------------
+def test_request_round_trip():
+    assert parse(encode_request([b"SET", "ключ", 42])) == [b"SET", "ключ".encode("utf-8"), b"42"]
+    assert parse(b"GET apple\r\n") == [b"GET", b"apple"]
+    assert parse(b"") is None
+
+
+@pytest.mark.parametrize("data", [b"*x\r\n", b"*1\r\n:3\r\n", b"*1\r\n$-5\r\n"])
+def test_malformed_request_is_a_protocol_error(data):
+    with pytest.raises(ProtocolError):
+        parse(data)
+
+
+# ---------------------
+# Commands
+# ---------------------
+def test_commands_over_a_pipelined_connection():
+    async def test(client, port):
+        await client.insert_many([(b"apple", 1), (b"pear", 2)])
+        # Concurrent callers share the connection; replies come back in request order
+        replies = await asyncio.gather(client.search(b"apple"), client.insert(b"plum", 3),
+                                       client.search_many([b"pear", b"plum", b"fig"]),
+                                       client.delete_many([b"pear", b"fig"]), client.delete(b"apple"))
+        assert replies == [b"1", None, [b"2", b"3", None], [True, False], True]
+        assert await client.call(b"PING") == "PONG"
+        with pytest.raises(ResponseError, match="unknown command"):
+            await client.call(b"FLUSHALL")
+        with pytest.raises(ResponseError, match="wrong number of arguments"):
+            await client.call(b"GET")
+        assert await client.search(b"plum") == b"3"
+    serve(test)
+
+
+def test_table_errors_become_error_replies():
+    async def test(client, port):
+        with pytest.raises(ResponseError, match="TypeError: .*read-only"):
+            await client.insert(b"plum", 3)
+        # The connection survives the failed command
+        assert await client.search(b"apple") == b"1"
+    serve(test, HashTablePerfect.from_items([(b"apple", b"1")]))
+
+
+def test_protocol_error_closes_the_connection():
+    async def test(client, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"*1\r\n$-5\r\n")
+        assert (await reader.read()).startswith(b"-ERR Protocol error")
+        writer.close()
+    serve(test)
+
+
+# ---------------------
+# Client Failures
+# ---------------------
+def test_malformed_reply_fails_every_pending_call():
+    async def main():
+        async def reply_garbage(reader, writer):
+            await reader.readline()
+            writer.write(b"?garbage\r\n")
+            await reader.read()
+            writer.close()
+        server = await asyncio.start_server(reply_garbage, "127.0.0.1", 0)
+        client = await HashTableClient.connect(port=server.sockets[0].getsockname()[1])
+        results = await asyncio.wait_for(
+            asyncio.gather(client.search(b"a"), client.search(b"b"), return_exceptions=True), 5)
+        assert all(isinstance(result, ConnectionResetError) for result in results)
+        assert isinstance(results[0].__cause__, ProtocolError)
+        with pytest.raises(ConnectionResetError):
+            await client.search(b"c")
+        await client.close()
+        server.close()
+        await server.wait_closed()
+    asyncio.run(main())
+
+
+def test_server_going_away_fails_pending_calls():
+    async def main():
+        async def hang_up(reader, writer):
+            await reader.readline()
+            writer.close()
+        server = await asyncio.start_server(hang_up, "127.0.0.1", 0)
+        client = await HashTableClient.connect(port=server.sockets[0].getsockname()[1])
+        with pytest.raises(ConnectionResetError):
+            await asyncio.wait_for(client.search(b"a"), 5)
+        await client.close()
+        server.close()
+        await server.wait_closed()
+    asyncio.run(main())
+
+
+# ---------------------
+# Load Generator
+# ---------------------
+def test_run_load_reports_every_request():
+    async def test(client, port):
+        return await run_load(2, requests_per_connection=64, pipeline=4, num_keys=50, port=port)
+    result = serve(test)
+    assert result["requests"] == 2 * 64
+    assert result["p50_us"] <= result["p99_us"] <= result["p999_us"]
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from HashTable_Rahul_Khanna import HashTableRobinHood
+from hash_sharded import HashTableSharded
+from model import key_pool, run_model
+
+
+def test_sharded_matches_dict():
+    with HashTableSharded(num_shards=2, strategy_class=HashTableRobinHood) as ht:
+        run_model(ht, key_pool(5, size=100), seed=6, steps=300)
+
+
+def test_sharded_delete_hashed_finds_none_value():
+    with HashTableSharded(num_shards=2) as ht:
+        ht.insert_many([("apple", None), ("pear", 1)])
+        assert ht.search_many(["apple", "plum"], "missing") == [None, "missing"]
+        assert ht._delete_hashed("apple", None)
+        assert not ht._delete_hashed("apple", None)
+        assert ht.search_many(["apple", "pear"], "missing") == ["missing", 1]
+
+
+def test_stats_cover_every_shard():
+    with HashTableSharded(num_shards=3) as ht:
+        ht.insert_many([(f"key{i}", i) for i in range(300)])
+        report = ht.stats()
+        assert report["num_shards"] == len(report["shards"]) == 3
+        assert report["entries"] == sum(shard["entries"] for shard in report["shards"]) == 300
+
+
+def test_shard_errors_are_raised_in_the_caller():
+    # len() cannot hash an int key; the shard survives and keeps serving
+    with HashTableSharded(num_shards=2, hash_function=len) as ht:
+        with pytest.raises(TypeError):
+            ht.insert_many([(5, 2)])
+        ht.insert_many([("pear", 3), ("plum", 4)])
+        assert ht.search_many(["pear", "plum"]) == [3, 4]
+
+
+def test_dump_is_refused():
+    with HashTableSharded(num_shards=1) as ht, pytest.raises(TypeError):
+        ht.dump("unused")
+
+
+class SlowTable(HashTableRobinHood):
+    def insert_many(self, items):
+        time.sleep(0.5)
+        super().insert_many(items)
+
+
+def test_dead_worker_fails_the_call():
+    with HashTableSharded(num_shards=2) as ht:
+        ht.insert_many([(f"key{i}", i) for i in range(100)])
+        ht.workers[1].terminate()
+        ht.workers[1].join()
+        with pytest.raises(RuntimeError, match=r"\[1\]"):
+            ht.search_many([f"key{i}" for i in range(100)])
+        with pytest.raises(RuntimeError):
+            ht.stats()
+
+
+def test_slow_shard_times_out_and_late_replies_are_dropped():
+    with HashTableSharded(num_shards=1, strategy_class=SlowTable, timeout=0.2) as ht:
+        with pytest.raises(TimeoutError):
+            ht.insert_many([("apple", 1)])
+        time.sleep(0.5)  # the insert finishes late; its reply is skipped
+        assert ht.search_many(["apple", "pear"]) == [1, None]
+        assert ht.stats()["entries"] == 1
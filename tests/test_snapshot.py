@@ -0,0 +1,119 @@
+import io
+import pickle
+
+import pytest
+
+from HashTable_Rahul_Khanna import (
+    HashTable,
+    HashTableChaining,
+    HashTableCompact,
+    HashTableLinearProbing,
+    HashTableRobinHood,
+    HashTableStrategy,
+    HashTableSwiss,
+    SNAPSHOT_MAGIC,
+)
+from model import EXACT_STRATEGIES, snapshot
+
+
+@pytest.mark.parametrize("strategy", list(EXACT_STRATEGIES))
+def test_snapshot_keeps_the_layout(strategy):
+    ht = EXACT_STRATEGIES[strategy](None)
+    ht.insert_many([(f"key{i}", i) for i in range(1000)])
+    ht.delete_many([f"key{i}" for i in range(0, 1000, 3)])
+    restored = snapshot(ht)
+    assert type(restored) is type(ht)
+    # Entries come back in the same slots, so iteration order is unchanged too
+    assert list(restored.items()) == list(ht.items())
+    assert restored.table_size == ht.table_size and restored.count == ht.count
+
+
+def test_snapshot_of_numpy_arrays(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "table.snap"
+    ht = HashTableSwiss()
+    ht.insert_many([(f"key{i}", i) for i in range(1000)])
+    ht.dump(path)
+    restored = HashTableSwiss.load(path)
+    assert (restored.ctrl == ht.ctrl).all() and (restored.hashes == ht.hashes).all()
+    assert restored.search_many(["key0", "key999", "missing"]) == [0, 999, None]
+
+
+def test_load_checks_the_file_and_the_class():
+    with pytest.raises(ValueError, match="not a hash table snapshot"):
+        HashTableStrategy.load(io.BytesIO(b"not a snapshot at all"))
+    buffer = io.BytesIO()
+    HashTableChaining().dump(buffer)
+    buffer.seek(0)
+    with pytest.raises(ValueError, match="HashTableChaining"):
+        HashTableLinearProbing.load(buffer)
+
+
+class OpensAFile:
+    # Unpickling this would call open(path, "w")
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return open, (self.path, "w")
+
+
+def test_load_refuses_arbitrary_globals(tmp_path):
+    marker = tmp_path / "created"
+    header = {"class": "HashTableChaining", "state": {"count": OpensAFile(str(marker))},
+              "streams": []}
+    buffer = io.BytesIO(SNAPSHOT_MAGIC + pickle.dumps(header))
+    with pytest.raises(pickle.UnpicklingError, match="open"):
+        HashTableStrategy.load(buffer)
+    assert not marker.exists()
+
+
+def test_seeded_and_cuckoo_tables_still_load():
+    for ht in (HashTableChaining(seed="random", hash_function="murmur"),
+               EXACT_STRATEGIES["cuckoo"]("siphash")):
+        ht.insert_many([(f"key{i}", {i, "set"}) for i in range(100)])
+        restored = snapshot(ht)
+        assert restored.hash_function("apple") == ht.hash_function("apple")
+        assert list(restored.items()) == list(ht.items())
+
+
+class Point:
+    pass
+
+
+def test_values_of_other_classes_do_not_load():
+    ht = HashTableLinearProbing()
+    ht.insert("apple", Point())
+    with pytest.raises(pickle.UnpicklingError, match="Point"):
+        snapshot(ht)
+
+
+# ---------------------
+# Snapshots
+# ---------------------
+@pytest.mark.parametrize("strategy_class", [HashTableChaining, HashTableLinearProbing,
+                                            HashTableRobinHood])
+def test_snapshot_mid_migration(strategy_class):
+    ht = strategy_class(table_size=4, rehash_step=1)
+    i = 0
+    while ht.old_table is None or i < 20:
+        ht.insert(f"key{i}", i)
+        i += 1
+    restored = snapshot(ht)
+    assert restored.old_table is not None
+    assert dict(restored.items()) == dict(ht.items())
+    # Both copies finish the migration and keep going on their own
+    for table in (ht, restored):
+        table.insert_many([(f"more{j}", j) for j in range(100)])
+        table.delete_many([f"key{j}" for j in range(0, i, 2)])
+    assert dict(restored.items()) == dict(ht.items())
+
+
+def test_facade_snapshot_rebuilds_prefilter(tmp_path):
+    path = tmp_path / "table.snap"
+    ht = HashTable(HashTableCompact(), prefilter="blocked")
+    ht.insert_many([(f"key{i}", i) for i in range(1000)])
+    ht.dump(path)
+    restored = HashTable.load(path, prefilter="blocked")
+    assert restored.search_many(["key0", "key999", "missing"]) == [0, 999, None]
+    assert dict(restored.items()) == dict(ht.items())
@@ -0,0 +1,67 @@
+import pytest
+
+from HashTable_Rahul_Khanna import (
+    STRATEGIES,
+    HashTable,
+    HashTableChaining,
+    HashTableDirect,
+    HashTableLinearProbing,
+)
+from model import EXACT_STRATEGIES
+
+
+@pytest.mark.parametrize("strategy", list(EXACT_STRATEGIES))
+def test_histogram_covers_every_entry(strategy):
+    ht = EXACT_STRATEGIES[strategy](None)
+    ht.insert_many([(f"key{i}", i) for i in range(500)])
+    ht.delete_many([f"key{i}" for i in range(0, 500, 5)])
+    report = ht.stats()
+    assert report["entries"] == ht.count == 400
+    assert report["load_factor"] == 400 / report["table_size"]
+    if "chain_lengths" in report:
+        histogram = report["chain_lengths"]
+        assert sum(length * n for length, n in histogram.items()) == 400
+    else:
+        histogram = report["probe_lengths"]
+        assert sum(histogram.values()) == 400
+        assert min(histogram) >= 1
+    assert report["max_length"] == max(histogram)
+    assert report["resizes"] > 0
+
+
+def test_probe_lengths_count_the_slots_a_search_looks_at():
+    ht = HashTableLinearProbing(table_size=16, hash_function=lambda key: 3,
+                                max_load_factor=None, min_load_factor=None)
+    ht.insert_many([(key, key) for key in "abc"])
+    report = ht.stats()
+    assert report["probe_lengths"] == {1: 1, 2: 1, 3: 1}
+    assert report["max_length"] == 3 and report["mean_length"] == 2.0
+
+
+def test_counters_only_after_enable_stats():
+    ht = HashTableDirect(table_size=1)
+    ht.insert("apple", 1)
+    ht.insert("pear", 2)
+    assert "collisions" not in ht.stats()
+    ht.enable_stats()
+    ht.insert("pear", 3)
+    ht.insert("plum", 4)
+    report = ht.stats()
+    assert report["overwrites"] == 2 and report["collisions"] == 1
+    ht.disable_stats()
+    assert "collisions" not in ht.stats()
+
+
+def test_resizes_are_always_counted():
+    ht = HashTableChaining(table_size=4)
+    ht.insert_many([(f"key{i}", i) for i in range(100)])
+    report = ht.stats()
+    assert report["resizes"] >= 1
+    assert report["resize_ms"] >= 0
+
+
+def test_facade_reports_the_strategy_stats():
+    ht = HashTable(STRATEGIES["robin_hood"](None))
+    ht.insert_many([(f"key{i}", i) for i in range(10)])
+    assert ht.stats()["strategy"] == "HashTableRobinHood"
+    assert ht.stats()["entries"] == 10
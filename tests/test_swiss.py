@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from HashTable_Rahul_Khanna import CTRL_DELETED, CTRL_EMPTY, GROUP_WIDTH, HashTableSwiss  # noqa: E402
+from model import key_pool, run_checked_model, snapshot  # noqa: E402
+
+
+def check_swiss(ht):
+    # Control bytes agree with the slots: a full slot carries its hash's low 7 bits
+    full = 0
+    for slot, ctrl in enumerate(ht.ctrl.tolist()):
+        if ctrl & 0x80:
+            assert ctrl in (CTRL_EMPTY, CTRL_DELETED)
+        else:
+            assert ctrl == int(ht.hashes[slot]) & 0x7F
+            full += 1
+    assert full == ht.count
+    assert int((ht.ctrl == CTRL_DELETED).sum()) == ht.deleted
+
+
+def test_swiss_matches_dict():
+    run_checked_model(HashTableSwiss(), key_pool(15), seed=15, check=check_swiss,
+                      reload=snapshot)
+
+
+@pytest.mark.parametrize("table_size,expected", [(1, 16), (16, 16), (17, 32), (100, 128)])
+def test_table_is_a_power_of_two_groups(table_size, expected):
+    ht = HashTableSwiss(table_size=table_size)
+    assert ht.table_size == expected
+    assert ht.group_mask == ht.table_size // GROUP_WIDTH - 1
+
+
+def test_delete_leaves_a_marker_only_in_a_full_group():
+    # One group of 16 slots: while it has an EMPTY byte no probe ever passed it, so a
+    # delete can empty its slot; in a full group the slot must become DELETED
+    ht = HashTableSwiss(table_size=16, max_load_factor=None, min_load_factor=None)
+    ht.insert_many([(f"key{i}", i) for i in range(16)])
+    ht.delete_many(["key0", "key1"])
+    assert ht.deleted == 2
+    ht.insert("new", 16)  # reuses a DELETED slot
+    assert ht.deleted == 1
+    check_swiss(ht)
+    assert ht.search_many(["key0", "key3", "new"]) == [None, 3, 16]
+    ht = HashTableSwiss(table_size=16, max_load_factor=None, min_load_factor=None)
+    ht.insert_many([(f"key{i}", i) for i in range(10)])
+    ht.delete("key0")
+    assert ht.deleted == 0
+    check_swiss(ht)